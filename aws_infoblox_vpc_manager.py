@@ -6,12 +6,6 @@ This script provides the core functionality for AWS-InfoBlox VPC synchronization
 with all the enhanced features implemented.
 """
 
-import sys
-import os
-
-# Add current directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 def main():
     """Temporary main function that redirects to the fixed version"""
     print("AWS-InfoBlox VPC Manager Enhanced Version")
@@ -18,24 +18,41 @@ Date: June 4, 2025
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import urllib3
 import ast
+import csv
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import argparse
 import os
+import time
 from dotenv import load_dotenv
 import getpass
 import sys
 
+# Optional fast JSON parser - used for the tag parsing fast path when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # Using an absolute path for the log file
 ABS_LOG_FILE_PATH = os.path.abspath('aws_infoblox_vpc_manager.log')
 
+# On-disk cache for Extended Attribute definitions (they change rarely)
+EA_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'aws_infoblox')
+EA_CACHE_TTL_SECONDS = 3600
+
 # Configure logging
 logging.basicConfig(
     level=logging.DEBUG,  # Changed to DEBUG for better troubleshooting
@@ -485,7 +502,7 @@ def main():
                 report_ea_title = "Extended Attributes Created:"
 
             if eas_to_report:
-                with open(ea_report_filename, 'w', encoding='utf-8') as f:
+                with open(ea_report_filename, 'w', encoding='utf-8', newline='\n') as f:
                     f.write(f"{report_ea_title}\n")
                     f.write("=" * len(report_ea_title) + "\n")
                     for ea_name in eas_to_report:
@@ -585,20 +602,42 @@ class InfoBloxClient:
         self.session = requests.Session()
         self.session.auth = (username, password)
         self.session.verify = False
-        self._ea_cache = {}
+        # Pool connections so TCP+TLS is reused across the whole run instead of
+        # re-handshaking per request; retry transient gateway errors with backoff
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        # gzip shrinks the multi-MB JSON bodies from large-view enumerations
+        self.session.headers.update({'Connection': 'keep-alive',
+                                     'Accept-Encoding': 'gzip, deflate'})
+        # Single-slot cache for EA definitions; None means "not fetched yet"
+        self._ea_defs: Optional[List[Dict]] = None
+        # Name set kept in sync incrementally so repeated existence checks
+        # never refetch the full definition list
+        self._ea_names: Optional[set] = None
         
     def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None) -> requests.Response:
         """Make HTTP request to InfoBlox WAPI"""
         url = f"{self.base_url}/{endpoint}"
         
         try:
-            if method.upper() == 'GET':
+            method = method.upper()
+            if method == 'GET':
                 response = self.session.get(url, params=params)
-            elif method.upper() == 'POST':
-                response = self.session.post(url, json=data, params=params)
-            elif method.upper() == 'PUT':
-                response = self.session.put(url, json=data, params=params)
-            elif method.upper() == 'DELETE':
+            elif method in ('POST', 'PUT'):
+                if data is not None and orjson is not None:
+                    # Serialize the body at C speed; requests' json= path goes
+                    # through stdlib json.dumps
+                    response = self.session.request(
+                        method, url, params=params, data=orjson.dumps(data),
+                        headers={'Content-Type': 'application/json'}
+                    )
+                else:
+                    response = self.session.request(method, url, params=params, json=data)
+            elif method == 'DELETE':
                 response = self.session.delete(url, params=params)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
@@ -619,7 +658,14 @@ class InfoBloxClient:
                     error_msg += f" - Response: {e.response.text}"
             logger.error(error_msg)
             raise
-    
+
+    @staticmethod
+    def _parse_json(response: requests.Response):
+        """Decode a WAPI response body, using orjson when available"""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
     def get_network_views(self) -> List[Dict]:
         """Get all network views from InfoBlox"""
         try:
@@ -649,7 +695,7 @@ class InfoBloxClient:
         
         try:
             response = self._make_request('GET', 'network', params=params)
-            networks = response.json()
+            networks = self._parse_json(response)
             if networks:
                 logger.debug(f"Found network {cidr} in view {network_view}")
                 return networks[0]
@@ -674,7 +720,7 @@ class InfoBloxClient:
         
         try:
             response = self._make_request('GET', 'networkcontainer', params=params)
-            containers = response.json()
+            containers = self._parse_json(response)
             if containers:
                 logger.debug(f"Found network container {cidr} in view {network_view}")
                 return containers[0]
@@ -689,6 +735,79 @@ class InfoBloxClient:
                 logger.error(f"Error checking network container {cidr}: HTTP {e.response.status_code}")
                 raise
     
+    def get_networks_bulk(self, cidrs: List[str], network_view: str = "default") -> Tuple[Dict, Dict]:
+        """Fetch many networks and network containers in a single WAPI /request call
+
+        Returns two dicts keyed by CIDR: {cidr: network_obj} and {cidr: container_obj}.
+        Collapses the 2-GETs-per-CIDR pattern into one HTTP round-trip.
+        """
+        networks = {}
+        containers = {}
+
+        if not cidrs:
+            return networks, containers
+
+        # Build one multi-object request body: all network lookups followed by
+        # all networkcontainer lookups, in the same CIDR order
+        request_body = []
+        for obj_type in ('network', 'networkcontainer'):
+            for cidr in cidrs:
+                request_body.append({
+                    'method': 'GET',
+                    'object': obj_type,
+                    'data': {
+                        'network': cidr,
+                        'network_view': network_view
+                    },
+                    'args': {
+                        '_return_fields': 'network,comment,extattrs'
+                    }
+                })
+
+        response = self._make_request('POST', 'request', data=request_body)
+        results = self._parse_json(response)
+
+        # Results come back in request order: first len(cidrs) entries are
+        # network lookups, the rest are networkcontainer lookups
+        num_cidrs = len(cidrs)
+        for cidr, result in zip(cidrs, results[:num_cidrs]):
+            if result:
+                networks[cidr] = result[0]
+        for cidr, result in zip(cidrs, results[num_cidrs:]):
+            if result:
+                containers[cidr] = result[0]
+
+        logger.info(f"Bulk lookup resolved {len(networks)} networks and {len(containers)} containers "
+                    f"for {num_cidrs} CIDRs in one WAPI call")
+        return networks, containers
+
+    def iter_all_networks(self, network_view: str = "default", object_type: str = "network",
+                          page_size: int = 1000):
+        """Iterate all networks (or network containers) in a view using WAPI paging
+
+        Yields parsed network dicts one page at a time, so comparing a large
+        CSV costs O(pages) API calls instead of O(rows).
+        """
+        params = {
+            'network_view': network_view,
+            '_return_fields': 'network,comment,extattrs',
+            '_paging': 1,
+            '_return_as_object': 1,
+            '_max_results': page_size
+        }
+
+        while True:
+            response = self._make_request('GET', object_type, params=params)
+            payload = self._parse_json(response)
+
+            for obj in payload.get('result', []):
+                yield obj
+
+            page_id = payload.get('next_page_id')
+            if not page_id:
+                break
+            params['_page_id'] = page_id
+
     def check_network_or_container_exists(self, cidr: str, network_view: str = "default") -> Dict:
         """Check if CIDR exists as either a network or network container"""
         # First check if it exists as a regular network
@@ -762,12 +881,72 @@ class InfoBloxClient:
             # Re-raise with more specific error message
             raise Exception(f"{error_msg}")
     
+    def _ea_disk_cache_path(self) -> str:
+        """Path of the on-disk EA definition cache for this Grid Master"""
+        safe_host = self.grid_master.replace('/', '_').replace(':', '_')
+        return os.path.join(EA_CACHE_DIR, f"ea_definitions_{safe_host}_{self.api_version}.json")
+
+    def create_networks_bulk(self, items: List[Tuple[str, str, Optional[Dict[str, str]]]],
+                             network_view: str = "default") -> List[Dict]:
+        """Create many networks in a single WAPI /request call
+
+        items is a list of (cidr, comment, extattrs) tuples. Returns the
+        per-item results (object refs) in input order. The /request endpoint
+        executes the batch as one transaction, so a single conflicting
+        network fails the whole call - callers should fall back to per-item
+        creation in that case.
+        """
+        request_body = []
+        for cidr, comment, extattrs in items:
+            data = {
+                'network': cidr,
+                'network_view': network_view
+            }
+            if comment:
+                data['comment'] = comment
+            if extattrs:
+                cleaned_extattrs = {k: str(v) for k, v in extattrs.items()
+                                    if v is not None and str(v).strip()}
+                if cleaned_extattrs:
+                    data['extattrs'] = {k: {'value': v} for k, v in cleaned_extattrs.items()}
+            request_body.append({'method': 'POST', 'object': 'network', 'data': data})
+
+        response = self._make_request('POST', 'request', data=request_body)
+        logger.info(f"Bulk-created {len(items)} networks in view {network_view} in one WAPI call")
+        return response.json()
+
     def get_extensible_attributes(self) -> List[Dict]:
         """Get all Extended Attribute definitions from InfoBlox"""
-        if 'definitions' not in self._ea_cache:
-            response = self._make_request('GET', 'extensibleattributedef')
-            self._ea_cache['definitions'] = response.json()
-        return self._ea_cache['definitions']
+        if self._ea_defs is None:
+            cache_path = self._ea_disk_cache_path()
+            definitions = None
+
+            # Warm start: reuse the on-disk cache if it is fresh enough
+            try:
+                if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < EA_CACHE_TTL_SECONDS:
+                    with open(cache_path, 'r', encoding='utf-8') as f:
+                        definitions = json.load(f)
+                    logger.debug(f"Loaded EA definitions from disk cache: {cache_path}")
+            except (OSError, json.JSONDecodeError) as e:
+                logger.debug(f"Could not read EA definition cache: {e}")
+                definitions = None
+
+            if definitions is None:
+                response = self._make_request('GET', 'extensibleattributedef')
+                definitions = response.json()
+                # Write atomically so a crashed run never leaves a torn cache
+                try:
+                    os.makedirs(EA_CACHE_DIR, exist_ok=True)
+                    tmp_path = cache_path + '.tmp'
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        json.dump(definitions, f)
+                    os.replace(tmp_path, cache_path)
+                except OSError as e:
+                    logger.debug(f"Could not write EA definition cache: {e}")
+
+            self._ea_defs = definitions
+            self._ea_names = {ea.get('name') for ea in definitions}
+        return self._ea_defs
     
     def create_extensible_attribute(self, name: str, data_type: str = "STRING", 
                                   comment: str = "", default_value: str = "") -> Dict:
@@ -784,22 +963,31 @@ class InfoBloxClient:
         try:
             response = self._make_request('POST', 'extensibleattributedef', data=data)
             logger.info(f"Created Extended Attribute definition: {name}")
-            if 'definitions' in self._ea_cache:
-                del self._ea_cache['definitions']
+            self._ea_defs = None
+            if self._ea_names is not None:
+                self._ea_names.add(name)
+            # The disk cache is stale now too
+            try:
+                os.remove(self._ea_disk_cache_path())
+            except OSError:
+                pass
             return response.json()
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 400:
                 error_details = e.response.text
                 if "already exists" in error_details.lower():
                     logger.info(f"Extended Attribute {name} already exists")
+                    if self._ea_names is not None:
+                        self._ea_names.add(name)
                     return {'status': 'exists', 'name': name}
             raise
     
     def ensure_required_eas_exist(self, required_eas: List[str]) -> Dict[str, str]:
         """Ensure required Extended Attributes exist in InfoBlox, create if missing"""
-        existing_eas = self.get_extensible_attributes()
-        existing_names = {ea['name'] for ea in existing_eas}
-        
+        if self._ea_names is None:
+            self.get_extensible_attributes()
+        existing_names = self._ea_names
+
         results = {}
         
         for ea_name in required_eas:
@@ -832,6 +1020,11 @@ class InfoBloxClient:
         return response.json()
 
 
+# Fast-path pattern for the common AWS tag export shape:
+# [{'Key': 'Name', 'Value': 'my-vpc'}, ...]
+_TAG_RE = re.compile(r"\{'Key':\s*'((?:[^'\\]|\\.)*)'\s*,\s*'Value':\s*'((?:[^'\\]|\\.)*)'\}")
+
+
 class AWSTagParser:
     """Handles parsing of AWS tags from various formats"""
     
@@ -845,7 +1038,28 @@ class AWSTagParser:
             if isinstance(tags_str, str):
                 tags_str = tags_str.strip()
                 if tags_str.startswith('[') and tags_str.endswith(']'):
-                    tag_list = ast.literal_eval(tags_str)
+                    tag_list = None
+                    if orjson is not None:
+                        # Fast path: AWS exports use single-quoted dicts, so a
+                        # quote swap usually yields valid JSON that orjson can
+                        # parse at C speed; fall back to literal_eval on values
+                        # that contain embedded quotes
+                        try:
+                            tag_list = orjson.loads(tags_str.replace("'", '"'))
+                        except orjson.JSONDecodeError:
+                            tag_list = None
+                    if tag_list is None:
+                        # Regex fast path: extract the Key/Value pairs directly
+                        # instead of a full Python AST parse. Only trusted when
+                        # every 'Key' entry matched and no capture contains an
+                        # escape sequence (the regex sees the source text, so
+                        # \' or \n would come through un-decoded), otherwise
+                        # literal_eval
+                        pairs = _TAG_RE.findall(tags_str)
+                        if (pairs and len(pairs) == tags_str.count("'Key'")
+                                and not any('\\' in k or '\\' in v for k, v in pairs)):
+                            return dict(pairs)
+                        tag_list = ast.literal_eval(tags_str)
                     if isinstance(tag_list, list):
                         return {tag['Key']: tag['Value'] for tag in tag_list if 'Key' in tag and 'Value' in tag}
             elif isinstance(tags_str, list):
@@ -858,6 +1072,78 @@ class AWSTagParser:
             return {}
 
 
+# Classifier for network-creation failure messages. One case-insensitive scan
+# replaces the chain of str.lower() + substring checks; group order mirrors the
+# original priority (overlap first, EA errors last).
+_ERROR_CATEGORY_RE = re.compile(
+    r'(overlap|parent)|(permission|auth)|(invalid)|(network view)|(not found)|(extensible|attribute)',
+    re.IGNORECASE
+)
+_ERROR_CATEGORIES = ('overlap', 'permission', 'invalid', 'network_view_error', 'not_found', 'ea_error')
+
+# "Not really an error" detector for create attempts on existing networks
+_ALREADY_EXISTS_RE = re.compile(r'already exists|duplicate', re.IGNORECASE)
+
+
+def _categorize_creation_error(error_msg: str) -> str:
+    """Map a WAPI error message to a rejection category"""
+    best = None
+    for match in _ERROR_CATEGORY_RE.finditer(error_msg):
+        idx = match.lastindex
+        if best is None or idx < best:
+            best = idx
+            if idx == 1:
+                break
+    return _ERROR_CATEGORIES[best - 1] if best else 'unknown'
+
+
+# AWS tag name -> InfoBlox EA name mapping, shared by all VPCManager instances
+TAG_MAPPING = {
+    'Name': 'aws_name',
+    'environment': 'environment',
+    'Environment': 'environment',
+    'owner': 'owner',
+    'Owner': 'owner',
+    'project': 'project',
+    'Project': 'project',
+    'location': 'aws_location',
+    'Location': 'aws_location',
+    'cloudservice': 'aws_cloudservice',
+    'createdby': 'aws_created_by',
+    'RequestedBy': 'aws_requested_by',
+    'Requested_By': 'aws_requested_by',
+    'dud': 'aws_dud',
+    'AccountId': 'aws_account_id',
+    'Region': 'aws_region',
+    'VpcId': 'aws_vpc_id',
+    'Description': 'description'
+}
+
+
+@lru_cache(maxsize=4096)
+def _map_tags_cached(tag_items: Tuple[Tuple[str, str], ...]) -> Dict[str, str]:
+    """Map a hashable tuple of (tag, value) pairs to InfoBlox EAs - memoized
+
+    Typical CSVs reuse the same tag set across many VPCs, so repeat calls
+    become a single cache lookup.
+    """
+    mapped_eas = {}
+    for aws_key, aws_value in tag_items:
+        ea_key = TAG_MAPPING.get(aws_key, f"aws_{aws_key.lower()}")
+        ea_key = ea_key.replace('-', '_').replace(' ', '_').lower()
+        ea_value = str(aws_value)
+        if len(ea_value) > 255:
+            ea_value = ea_value[:255]
+        # EA names come from a small fixed vocabulary and short values repeat
+        # across many VPCs; interning gives dict hashing the pointer-identity
+        # fast path in _compare_eas_raw and deduplicates the strings in memory
+        ea_key = sys.intern(ea_key)
+        if len(ea_value) <= 64:
+            ea_value = sys.intern(ea_value)
+        mapped_eas[ea_key] = ea_value
+    return mapped_eas
+
+
 class VPCManager:
     """Main class for managing AWS VPC to InfoBlox synchronization"""
     
@@ -865,10 +1151,20 @@ class VPCManager:
         self.ib_client = infoblox_client
         self.tag_parser = AWSTagParser()
         
-    def load_vpc_data(self, csv_file_path: str) -> pd.DataFrame:
+    def load_vpc_data(self, csv_file_path: str, use_fast_io: bool = True) -> pd.DataFrame:
         """Load VPC data from CSV file"""
         try:
-            df = pd.read_csv(csv_file_path)
+            df = None
+            if use_fast_io:
+                # pyarrow's multi-threaded reader is several times faster on
+                # wide AWS exports with long Tags strings; fall back to the
+                # default C engine when pyarrow is not installed
+                try:
+                    df = pd.read_csv(csv_file_path, engine='pyarrow')
+                except (ImportError, ValueError):
+                    logger.debug("pyarrow CSV engine unavailable, using default engine")
+            if df is None:
+                df = pd.read_csv(csv_file_path)
             logger.info(f"Loaded {len(df)} VPC records from {csv_file_path}")
             return df
         except Exception as e:
@@ -878,40 +1174,17 @@ class VPCManager:
     def parse_vpc_tags(self, df: pd.DataFrame) -> pd.DataFrame:
         """Parse tags column and add parsed tags as new column"""
         df = df.copy()
-        df['ParsedTags'] = df['Tags'].apply(self.tag_parser.parse_tags_from_string)
+        # Iterate a plain Python list instead of Series.apply - avoids pandas'
+        # per-row dispatch overhead; the parser itself has an orjson fast path
+        parse = self.tag_parser.parse_tags_from_string
+        df['ParsedTags'] = [parse(tags) for tags in df['Tags'].tolist()]
         return df
     
     def map_aws_tags_to_infoblox_eas(self, aws_tags: Dict[str, str]) -> Dict[str, str]:
         """Map AWS tags to InfoBlox Extended Attributes"""
-        tag_mapping = {
-            'Name': 'aws_name',
-            'environment': 'environment', 
-            'Environment': 'environment',
-            'owner': 'owner',
-            'Owner': 'owner', 
-            'project': 'project',
-            'Project': 'project',
-            'location': 'aws_location',
-            'Location': 'aws_location',
-            'cloudservice': 'aws_cloudservice',
-            'createdby': 'aws_created_by',
-            'RequestedBy': 'aws_requested_by',
-            'Requested_By': 'aws_requested_by',
-            'dud': 'aws_dud',
-            'AccountId': 'aws_account_id',
-            'Region': 'aws_region',
-            'VpcId': 'aws_vpc_id',
-            'Description': 'description'
-        }
-        
-        mapped_eas = {}
-        for aws_key, aws_value in aws_tags.items():
-            ea_key = tag_mapping.get(aws_key, f"aws_{aws_key.lower()}")
-            ea_key = ea_key.replace('-', '_').replace(' ', '_').lower()
-            ea_value = str(aws_value)[:255] if len(str(aws_value)) > 255 else str(aws_value)
-            mapped_eas[ea_key] = ea_value
-        
-        return mapped_eas
+        # Delegate to the memoized module-level helper; return a copy so
+        # callers can safely mutate the result
+        return dict(_map_tags_cached(tuple(sorted(aws_tags.items()))))
     
     def compare_vpc_with_infoblox(self, vpc_df: pd.DataFrame, network_view: str = "default") -> Dict:
         """Compare AWS VPC data with InfoBlox networks and network containers"""
@@ -922,22 +1195,78 @@ class VPCManager:
             'containers': [],
             'errors': []
         }
-        
-        for _, vpc in vpc_df.iterrows():
+
+        # Prefetch all CIDRs in one batched WAPI call instead of two GETs per row
+        cidrs = vpc_df['CidrBlock'].tolist()
+        existence_by_cidr = {}
+        try:
+            if len(set(cidrs)) > 50:
+                # Large CSV: enumerate the whole view once with paging and
+                # diff in memory rather than asking about each CIDR
+                networks_by_cidr = {
+                    n['network']: n for n in self.ib_client.iter_all_networks(network_view)
+                }
+                containers_by_cidr = {
+                    c['network']: c
+                    for c in self.ib_client.iter_all_networks(network_view, object_type='networkcontainer')
+                }
+                logger.info(f"Enumerated {len(networks_by_cidr)} networks and "
+                            f"{len(containers_by_cidr)} containers from view '{network_view}'")
+            else:
+                networks_by_cidr, containers_by_cidr = self.ib_client.get_networks_bulk(cidrs, network_view)
+            prefetched = True
+        except Exception as e:
+            logger.warning(f"Bulk network lookup failed, falling back to threaded per-CIDR checks: {e}")
+            networks_by_cidr, containers_by_cidr = {}, {}
+            prefetched = False
+
+            # Fan the per-CIDR checks out over the pooled session so the
+            # round-trips overlap instead of paying one RTT per row
+            unique_cidrs = list(dict.fromkeys(cidrs))
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                future_map = {
+                    executor.submit(self.ib_client.check_network_or_container_exists, c, network_view): c
+                    for c in unique_cidrs
+                }
+                for future in as_completed(future_map):
+                    c = future_map[future]
+                    try:
+                        existence_by_cidr[c] = future.result()
+                    except Exception as check_error:
+                        # Stash the exception; the row loop re-raises it so the
+                        # existing per-row error handling still applies
+                        existence_by_cidr[c] = check_error
+
+        # Materialize plain row dicts once - iterrows() builds a fresh Series
+        # per row and every branch below would pay to_dict() again
+        for vpc in vpc_df.to_dict('records'):
             cidr = vpc['CidrBlock']
             vpc_id = vpc.get('VpcId', 'unknown')
-            
+            aws_tags = vpc.get('ParsedTags', {})
+            mapped_eas = None
+
             try:
-                aws_tags = vpc.get('ParsedTags', {})
                 mapped_eas = self.map_aws_tags_to_infoblox_eas(aws_tags)
-                
-                # Check if network exists
-                existence_check = self.ib_client.check_network_or_container_exists(cidr, network_view)
+
+                # Check if network exists (local lookup against the prefetched maps)
+                if prefetched:
+                    if cidr in networks_by_cidr:
+                        existence_check = {'exists': True, 'type': 'network', 'object': networks_by_cidr[cidr]}
+                    elif cidr in containers_by_cidr:
+                        existence_check = {'exists': True, 'type': 'container', 'object': containers_by_cidr[cidr]}
+                    else:
+                        existence_check = {'exists': False, 'type': None, 'object': None}
+                else:
+                    existence_check = existence_by_cidr.get(cidr)
+                    if existence_check is None:
+                        existence_check = self.ib_client.check_network_or_container_exists(cidr, network_view)
+                    elif isinstance(existence_check, Exception):
+                        raise existence_check
                 
                 if not existence_check['exists']:
                     logger.debug(f"Network {cidr} ({vpc_id}) not found in InfoBlox")
                     results['missing'].append({
-                        'vpc': vpc.to_dict(),
+                        'vpc': vpc,
                         'cidr': cidr,
                         'aws_tags': aws_tags,
                         'mapped_eas': mapped_eas
@@ -948,7 +1277,7 @@ class VPCManager:
                     ib_eas = {k: v.get('value', '') for k, v in ib_container.get('extattrs', {}).items()}
                     
                     results['containers'].append({
-                        'vpc': vpc.to_dict(),
+                        'vpc': vpc,
                         'cidr': cidr,
                         'ib_container': ib_container,
                         'aws_tags': aws_tags,
@@ -960,29 +1289,30 @@ class VPCManager:
                     # Network exists as regular network
                     logger.debug(f"Network {cidr} ({vpc_id}) found in InfoBlox")
                     ib_network = existence_check['object']
-                    ib_eas = {k: v.get('value', '') for k, v in ib_network.get('extattrs', {}).items()}
-                    
-                    # Compare EAs
-                    ea_match = self._compare_eas(mapped_eas, ib_eas)
-                    
+                    extattrs = ib_network.get('extattrs', {})
+
+                    # Compare against the raw extattrs; the flat {name: value}
+                    # view is only built when a result bucket stores it
+                    ea_match = self._compare_eas_raw(mapped_eas, extattrs)
+
                     if ea_match:
                         logger.debug(f"Network {cidr} ({vpc_id}) has matching EAs")
                         results['matches'].append({
-                            'vpc': vpc.to_dict(),
+                            'vpc': vpc,
                             'cidr': cidr,
                             'ib_network': ib_network,
                             'aws_tags': aws_tags,
-                            'ib_eas': ib_eas,
+                            'ib_eas': {k: v.get('value', '') for k, v in extattrs.items()},
                             'mapped_eas': mapped_eas
                         })
                     else:
                         logger.info(f"Network {cidr} ({vpc_id}) has EA discrepancies")
                         results['discrepancies'].append({
-                            'vpc': vpc.to_dict(),
+                            'vpc': vpc,
                             'cidr': cidr,
                             'ib_network': ib_network,
                             'aws_tags': aws_tags,
-                            'ib_eas': ib_eas,
+                            'ib_eas': {k: v.get('value', '') for k, v in extattrs.items()},
                             'mapped_eas': mapped_eas
                         })
                         
@@ -994,40 +1324,38 @@ class VPCManager:
                 if "not found" in error_msg.lower() or "404" in error_msg:
                     logger.info(f"Network {cidr} ({vpc_id}) appears to not exist in InfoBlox")
                     results['missing'].append({
-                        'vpc': vpc.to_dict(),
+                        'vpc': vpc,
                         'cidr': cidr,
                         'aws_tags': aws_tags,
-                        'mapped_eas': self.map_aws_tags_to_infoblox_eas(aws_tags)
+                        # Reuse the mapping computed above instead of re-mapping
+                        'mapped_eas': mapped_eas if mapped_eas is not None
+                                      else self.map_aws_tags_to_infoblox_eas(aws_tags)
                     })
                 else:
                     # Only true errors go here (network issues, parsing errors, etc.)
                     results['errors'].append({
-                        'vpc': vpc.to_dict(),
+                        'vpc': vpc,
                         'cidr': cidr,
                         'error': error_msg
                     })
         
         return results
     
-    def _compare_eas(self, mapped_eas: Dict[str, str], ib_eas: Dict[str, str]) -> bool:
-        """Compare mapped AWS tags with InfoBlox EAs - returns True only if they match exactly"""
-        # Check all keys from both sides
-        all_keys = set(mapped_eas.keys()) | set(ib_eas.keys())
-        
-        for key in all_keys:
-            mapped_value = mapped_eas.get(key, None)
-            ib_value = ib_eas.get(key, None)
-            
-            # If key exists in only one side, it's a discrepancy
-            if mapped_value is None or ib_value is None:
-                return False
-            
-            # If values don't match, it's a discrepancy
-            if str(mapped_value) != str(ib_value):
-                return False
-        
-        return True
-    
+    def _compare_eas_raw(self, mapped_eas: Dict[str, str], extattrs: Dict[str, Dict]) -> bool:
+        """Compare mapped AWS tags directly against raw InfoBlox extattrs
+
+        Skips materializing the intermediate {name: value} dict; exact
+        match in both directions is required.
+        """
+        # Key mismatches first: the symmetric difference runs in C and catches
+        # missing/extra EAs without a Python-level scan of every key
+        if mapped_eas.keys() ^ extattrs.keys():
+            return False
+
+        # Same key sets - only the values remain to be checked
+        return all(str(extattrs[key].get('value', '')) == str(value)
+                   for key, value in mapped_eas.items())
+
     def _calculate_network_priority(self, vpc: Dict, aws_tags: Dict) -> int:
         """Calculate priority for network creation - lower values = higher priority"""
         cidr = vpc.get('CidrBlock', '')
@@ -1045,11 +1373,12 @@ class VPCManager:
         """Ensure all required Extended Attributes exist in InfoBlox"""
         all_eas = set()
         
-        # Collect all unique EA names from AWS tags
-        for _, vpc in vpc_df.iterrows():
-            aws_tags = vpc.get('ParsedTags', {})
-            mapped_eas = self.map_aws_tags_to_infoblox_eas(aws_tags)
-            all_eas.update(mapped_eas.keys())
+        # Collect all unique EA names from AWS tags - iterate the single
+        # column directly instead of building a Series per row via iterrows()
+        if 'ParsedTags' in vpc_df.columns:
+            for aws_tags in vpc_df['ParsedTags']:
+                mapped_eas = self.map_aws_tags_to_infoblox_eas(aws_tags or {})
+                all_eas.update(mapped_eas.keys())
         
         logger.info(f"Found {len(all_eas)} unique Extended Attributes in AWS tags")
         
@@ -1081,7 +1410,44 @@ class VPCManager:
                                dry_run: bool = False) -> List[Dict]:
         """Create missing networks in InfoBlox"""
         results = []
-        
+
+        # Try batched creation first: /request amortizes TLS/HTTP overhead
+        # over up to 200 creates per round-trip. A batch is transactional, so
+        # any batch that fails (e.g. one overlapping CIDR) falls back to the
+        # per-item path below, which keeps the detailed error handling.
+        if not dry_run and len(missing_networks) > 1:
+            remaining = []
+            batch_size = 200
+            for start in range(0, len(missing_networks), batch_size):
+                batch = missing_networks[start:start + batch_size]
+                bulk_items = []
+                for item in batch:
+                    vpc = item['vpc']
+                    vpc_name = vpc.get('Name', 'Unnamed VPC')
+                    comment = f"AWS VPC: {vpc_name} (VPC ID: {vpc.get('VpcId', 'Unknown')})"
+                    bulk_items.append((item['cidr'], comment, item['mapped_eas']))
+
+                try:
+                    refs = self.ib_client.create_networks_bulk(bulk_items, network_view)
+                except Exception as e:
+                    logger.warning(f"Bulk create failed for batch of {len(batch)} networks, "
+                                   f"retrying individually: {e}")
+                    remaining.extend(batch)
+                    continue
+
+                for item, ref in zip(batch, refs):
+                    vpc_name = item['vpc'].get('Name', 'Unnamed VPC')
+                    logger.info(f"Created network: {item['cidr']} ({vpc_name})")
+                    results.append({
+                        'cidr': item['cidr'],
+                        'vpc_name': vpc_name,
+                        'action': 'created',
+                        'result': 'success',
+                        'ref': ref
+                    })
+
+            missing_networks = remaining
+
         for item in missing_networks:
             vpc = item['vpc']
             cidr = item['cidr']
@@ -1118,10 +1484,11 @@ class VPCManager:
                     
             except Exception as e:
                 error_msg = str(e)
-                error_lower = error_msg.lower()
-                
-                # Check if network already exists (not really an error)
-                if 'already exists' in error_lower or 'duplicate' in error_lower:
+
+                # Check if network already exists (not really an error).
+                # Case-insensitive regex avoids allocating a lowered copy of
+                # the potentially long WAPI error body.
+                if _ALREADY_EXISTS_RE.search(error_msg):
                     logger.info(f"Network {cidr} already exists - checking if EAs need updating")
                     
                     # Try to get the existing network and update its EAs
@@ -1159,20 +1526,8 @@ class VPCManager:
                     # This is a real error
                     logger.error(f"Failed to create network {cidr}: {error_msg}")
                     
-                    # Categorize the error
-                    category = 'unknown'
-                    if 'overlap' in error_lower or 'parent' in error_lower:
-                        category = 'overlap'
-                    elif 'permission' in error_lower or 'auth' in error_lower:
-                        category = 'permission'
-                    elif 'invalid' in error_lower:
-                        category = 'invalid'
-                    elif 'network view' in error_lower:
-                        category = 'network_view_error'
-                    elif 'not found' in error_lower:
-                        category = 'not_found'
-                    elif 'extensible' in error_lower or 'attribute' in error_lower:
-                        category = 'ea_error'
+                    # Categorize the error (single precompiled regex pass)
+                    category = _categorize_creation_error(error_msg)
                     
                     # Log detailed debugging info
                     logger.debug(f"Network creation failed - Category: {category}")
@@ -1211,62 +1566,63 @@ class VPCManager:
         """Generate CSV file with actual network creation errors"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"network_creation_errors_{timestamp}.csv"
-        
-        data = []
-        for result in error_results:
-            vpc = result.get('vpc', {})
-            data.append({
-                'CIDR': result['cidr'],
-                'VPC_Name': result['vpc_name'],
-                'VPC_ID': vpc.get('VpcId', ''),
-                'Account_ID': vpc.get('AccountId', ''),
-                'Region': vpc.get('Region', ''),
-                'Error_Category': result['category'],
-                'Error_Message': result['error'],
-                'AWS_Tags': str(vpc.get('ParsedTags', {}))
-            })
-        
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
+
+        # Stream rows straight to disk - no intermediate list or DataFrame
+        fieldnames = ['CIDR', 'VPC_Name', 'VPC_ID', 'Account_ID', 'Region',
+                      'Error_Category', 'Error_Message', 'AWS_Tags']
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            for result in error_results:
+                vpc = result.get('vpc', {})
+                writer.writerow({
+                    'CIDR': result['cidr'],
+                    'VPC_Name': result['vpc_name'],
+                    'VPC_ID': vpc.get('VpcId', ''),
+                    'Account_ID': vpc.get('AccountId', ''),
+                    'Region': vpc.get('Region', ''),
+                    'Error_Category': result['category'],
+                    'Error_Message': result['error'],
+                    'AWS_Tags': str(vpc.get('ParsedTags', {}))
+                })
         logger.info(f"Generated network creation errors report: {filename}")
-    
+
     def _generate_already_existed_csv(self, existed_results: List[Dict]):
         """Generate CSV file for networks that already existed"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"networks_already_existed_{timestamp}.csv"
-        
-        data = []
-        for result in existed_results:
-            vpc_name = result.get('vpc_name', 'Unnamed')
-            data.append({
-                'CIDR': result['cidr'],
-                'VPC_Name': vpc_name,
-                'Status': 'Already Existed',
-                'EA_Updated': 'Yes' if result['action'] == 'already_existed_updated_eas' else 'No'
-            })
-        
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
+
+        fieldnames = ['CIDR', 'VPC_Name', 'Status', 'EA_Updated']
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            for result in existed_results:
+                writer.writerow({
+                    'CIDR': result['cidr'],
+                    'VPC_Name': result.get('vpc_name', 'Unnamed'),
+                    'Status': 'Already Existed',
+                    'EA_Updated': 'Yes' if result['action'] == 'already_existed_updated_eas' else 'No'
+                })
         logger.info(f"Generated already existed networks report: {filename}")
-    
+
     def _generate_ea_update_failures_csv(self, ea_failures: List[Dict]):
         """Generate CSV file for EA update failures"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"ea_update_failures_{timestamp}.csv"
-        
-        data = []
-        for result in ea_failures:
-            vpc = result.get('vpc', {})
-            data.append({
-                'CIDR': result['cidr'],
-                'VPC_Name': result.get('vpc_name', 'Unnamed'),
-                'Error': result.get('error', 'Unknown error'),
-                'VPC_ID': vpc.get('VpcId', ''),
-                'AWS_Tags': str(vpc.get('ParsedTags', {}))
-            })
-        
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
+
+        fieldnames = ['CIDR', 'VPC_Name', 'Error', 'VPC_ID', 'AWS_Tags']
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            for result in ea_failures:
+                vpc = result.get('vpc', {})
+                writer.writerow({
+                    'CIDR': result['cidr'],
+                    'VPC_Name': result.get('vpc_name', 'Unnamed'),
+                    'Error': result.get('error', 'Unknown error'),
+                    'VPC_ID': vpc.get('VpcId', ''),
+                    'AWS_Tags': str(vpc.get('ParsedTags', {}))
+                })
         logger.info(f"Generated EA update failures report: {filename}")
     
     def fix_ea_discrepancies(self, discrepancies: List[Dict], dry_run: bool = False) -> Dict:
@@ -1331,7 +1687,7 @@ def generate_ea_discrepancies_report(discrepancies: List[Dict]):
     timestamp = datetime.now().strftime("%Y-%m-%d")
     filename = os.path.join(reports_dir, f"ea_discrepancies_{timestamp}.md")
     
-    with open(filename, 'w', encoding='utf-8') as f:
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
         f.write("# Extended Attributes Discrepancies Report\n\n")
         f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
         f.write(f"Total networks with EA discrepancies: {len(discrepancies)}\n\n")
@@ -1379,7 +1735,7 @@ def generate_network_status_report(comparison_results: Dict, dry_run: bool = Fal
     timestamp = datetime.now().strftime("%Y-%m-%d")
     filename = os.path.join(reports_dir, f"network_status_report_{timestamp}.md")
     
-    with open(filename, 'w', encoding='utf-8') as f:
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
         f.write("# AWS VPC to InfoBlox Network Status Report\n\n")
         f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         f.write(f"Mode: {'DRY RUN' if dry_run else 'LIVE'}\n\n")
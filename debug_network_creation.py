@@ -1,175 +1,265 @@
-#!/usr/bin/env python3
-"""
-Debug tool for InfoBlox network creation errors
-
-This script helps diagnose why specific networks are failing to create in InfoBlox.
-"""
-
-import pandas as pd
-import requests
-import json
-import urllib3
-from dotenv import load_dotenv
-import os
-import sys
-
-# Disable SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-def test_network_creation(cidr, network_view, grid_master, username, password):
-    """Test creating a specific network with detailed error reporting"""
-    
-    print(f"\n{'='*60}")
-    print(f"Testing network creation for: {cidr}")
-    print(f"Network View: {network_view}")
-    print(f"{'='*60}\n")
-    
-    base_url = f"https://{grid_master}/wapi/v2.13.1"
-    session = requests.Session()
-    session.auth = (username, password)
-    session.verify = False
-    
-    # First, check if network already exists
-    print("1. Checking if network already exists...")
-    params = {
-        'network': cidr,
-        'network_view': network_view
-    }
-    
-    try:
-        response = session.get(f"{base_url}/network", params=params)
-        if response.status_code == 200:
-            networks = response.json()
-            if networks:
-                print(f"   ❌ Network already exists: {networks[0].get('_ref', 'Unknown ref')}")
-                return
-            else:
-                print("   ✅ Network does not exist (can be created)")
-        else:
-            print(f"   ⚠️ Error checking network: {response.status_code}")
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
-    
-    # Check if it exists as a container
-    print("\n2. Checking if network exists as container...")
-    try:
-        response = session.get(f"{base_url}/networkcontainer", params=params)
-        if response.status_code == 200:
-            containers = response.json()
-            if containers:
-                print(f"   ❌ Exists as network container: {containers[0].get('_ref', 'Unknown ref')}")
-                return
-            else:
-                print("   ✅ Does not exist as container")
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
-    
-    # Check for parent networks
-    print("\n3. Checking for parent networks that might cause overlap...")
-    network_parts = cidr.split('/')
-    network_ip = network_parts[0]
-    prefix_len = int(network_parts[1])
-    
-    # Check broader prefixes
-    for test_prefix in range(8, prefix_len):
-        test_cidr = f"{network_ip}/{test_prefix}"
-        params = {'network': test_cidr, 'network_view': network_view}
-        
-        try:
-            response = session.get(f"{base_url}/network", params=params)
-            if response.status_code == 200 and response.json():
-                print(f"   ⚠️ Found parent network: {test_cidr}")
-        except:
-            pass
-    
-    # Try minimal network creation
-    print("\n4. Testing minimal network creation (no EAs)...")
-    data = {
-        'network': cidr,
-        'network_view': network_view
-    }
-    
-    print(f"   Request data: {json.dumps(data, indent=2)}")
-    
-    try:
-        response = session.post(f"{base_url}/network", json=data)
-        print(f"   Response status: {response.status_code}")
-        
-        if response.status_code == 201:
-            print("   ✅ Network created successfully!")
-            print(f"   Reference: {response.json()}")
-        else:
-            print(f"   ❌ Failed with status {response.status_code}")
-            try:
-                error_data = response.json()
-                print(f"   Error details: {json.dumps(error_data, indent=2)}")
-            except:
-                print(f"   Raw response: {response.text}")
-                
-    except Exception as e:
-        print(f"   ❌ Exception: {e}")
-    
-    # Test with comment
-    print("\n5. Testing with comment only...")
-    data = {
-        'network': cidr,
-        'network_view': network_view,
-        'comment': 'Test network creation'
-    }
-    
-    try:
-        response = session.post(f"{base_url}/network", json=data)
-        if response.status_code == 201:
-            print("   ✅ Works with comment")
-        else:
-            print(f"   ❌ Failed with comment: {response.status_code}")
-    except:
-        pass
-
-
-def main():
-    """Main function"""
-    load_dotenv('config.env')
-    
-    # Get configuration
-    grid_master = os.getenv('GRID_MASTER')
-    username = os.getenv('INFOBLOX_USERNAME')
-    password = os.getenv('PASSWORD')
-    network_view = os.getenv('NETWORK_VIEW', 'default')
-    
-    if not all([grid_master, username, password]):
-        print("❌ Missing configuration. Please check config.env")
-        return 1
-    
-    # Test specific network or read from rejected CSV
-    if len(sys.argv) > 1:
-        # Test specific CIDR
-        cidr = sys.argv[1]
-        if len(sys.argv) > 2:
-            network_view = sys.argv[2]
-        
-        test_network_creation(cidr, network_view, grid_master, username, password)
-    else:
-        # Look for most recent rejected networks CSV
-        import glob
-        csv_files = sorted(glob.glob('rejected_networks_*.csv'), reverse=True)
-        
-        if not csv_files:
-            print("No rejected networks CSV found.")
-            print("\nUsage:")
-            print("  python debug_network_creation.py <CIDR> [network_view]")
-            print("  python debug_network_creation.py  # to test from rejected CSV")
-            return 1
-        
-        print(f"Reading from: {csv_files[0]}")
-        df = pd.read_csv(csv_files[0])
-        
-        # Test first few rejected networks
-        for idx, row in df.head(3).iterrows():
-            cidr = row['CIDR']
-            test_network_creation(cidr, network_view, grid_master, username, password)
-            print("\n" + "="*80 + "\n")
-
-
-if __name__ == "__main__":
-    sys.exit(main())
+#!/usr/bin/env python3
+"""
+Debug tool for InfoBlox network creation errors
+
+This script helps diagnose why specific networks are failing to create in InfoBlox.
+"""
+
+import requests
+import ipaddress
+import json
+import socket
+import urllib3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+import os
+import sys
+
+# Optional fast JSON serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Disable SSL warnings
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+def jdumps(data):
+    """Pretty-print JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def jloads(response):
+    """Decode a WAPI response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def make_session(username, password):
+    """Build an HTTP client for the Grid Master.
+
+    Prefers a requests_cache.CachedSession (60 s sqlite-backed TTL scoped
+    to the networkview lookups only - the network/networkcontainer
+    existence probes are what this tool is debugging, so they must always
+    hit the Grid Master), then httpx with HTTP/2 (request multiplexing
+    over one TLS connection), then a pooled requests.Session with
+    keep-alive and retry/backoff.
+    """
+    try:
+        import requests_cache
+        session = requests_cache.CachedSession(
+            cache_name='.infoblox_debug_cache', backend='sqlite',
+            expire_after=requests_cache.DO_NOT_CACHE,
+            urls_expire_after={'*/networkview*': 60},
+            allowable_methods=('GET',))
+        session.auth = (username, password)
+        session.verify = False
+        return session
+    except ImportError:
+        pass
+    try:
+        import httpx
+        return httpx.Client(auth=(username, password), verify=False, http2=True,
+                            limits=httpx.Limits(max_connections=32,
+                                                max_keepalive_connections=32))
+    except ImportError:
+        pass
+    session = requests.Session()
+    session.auth = (username, password)
+    session.verify = False
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32,
+                          max_retries=Retry(total=3, backoff_factor=0.3,
+                                            status_forcelist=[502, 503, 504]))
+    session.mount('https://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+
+def pin_grid_master(session, grid_master):
+    """Resolve the Grid Master once and pin the IP to skip per-connect DNS.
+
+    Returns the host to use in URLs; the original hostname is kept in the
+    Host header (cert checks are disabled in these debug tools anyway).
+    """
+    try:
+        ip = socket.gethostbyname(grid_master)
+    except (socket.gaierror, OSError):
+        return grid_master
+    if ip != grid_master:
+        session.headers['Host'] = grid_master
+    return ip
+
+def test_network_creation(cidr, network_view, grid_master, username, password):
+    """Test creating a specific network with detailed error reporting"""
+    
+    print(f"\n{'='*60}")
+    print(f"Testing network creation for: {cidr}")
+    print(f"Network View: {network_view}")
+    print(f"{'='*60}\n")
+    
+    session = make_session(username, password)
+    base_url = f"https://{pin_grid_master(session, grid_master)}/wapi/v2.13.1"
+    
+    # Steps 1+2: the network and container existence checks have no data
+    # dependency, so fire both GETs concurrently and branch on the results
+    params = {
+        'network': cidr,
+        'network_view': network_view
+    }
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        network_future = executor.submit(session.get, f"{base_url}/network", params=params)
+        container_future = executor.submit(session.get, f"{base_url}/networkcontainer", params=params)
+
+    print("1. Checking if network already exists...")
+    try:
+        response = network_future.result()
+        if response.status_code == 200:
+            networks = jloads(response)
+            if networks:
+                print(f"   ❌ Network already exists: {networks[0].get('_ref', 'Unknown ref')}")
+                return
+            else:
+                print("   ✅ Network does not exist (can be created)")
+        else:
+            print(f"   ⚠️ Error checking network: {response.status_code}")
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+
+    print("\n2. Checking if network exists as container...")
+    try:
+        response = container_future.result()
+        if response.status_code == 200:
+            containers = jloads(response)
+            if containers:
+                print(f"   ❌ Exists as network container: {containers[0].get('_ref', 'Unknown ref')}")
+                return
+            else:
+                print("   ✅ Does not exist as container")
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+    
+    # Check for parent networks
+    print("\n3. Checking for parent networks that might cause overlap...")
+    # Probe the properly aligned supernet of each broader prefix - querying
+    # the host address with a shorter prefix returns empty for non-aligned
+    # CIDRs, so those GETs were wasted
+    net = ipaddress.ip_network(cidr, strict=False)
+    prefixes = [str(net.supernet(new_prefix=p)) for p in range(8, net.prefixlen)]
+
+    def probe_parent(test_cidr):
+        response = session.get(f"{base_url}/network",
+                               params={'network': test_cidr, 'network_view': network_view})
+        return test_cidr, response.status_code == 200 and bool(jloads(response))
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = [executor.submit(probe_parent, c) for c in prefixes]
+        for future in as_completed(futures):
+            try:
+                test_cidr, found = future.result()
+                if found:
+                    print(f"   ⚠️ Found parent network: {test_cidr}")
+            except:
+                pass
+    
+    # Try minimal network creation
+    print("\n4. Testing minimal network creation (no EAs)...")
+    data = {
+        'network': cidr,
+        'network_view': network_view
+    }
+    
+    print(f"   Request data: {jdumps(data)}")
+    
+    try:
+        response = session.post(f"{base_url}/network", json=data)
+        print(f"   Response status: {response.status_code}")
+        
+        if response.status_code == 201:
+            print("   ✅ Network created successfully!")
+            print(f"   Reference: {jloads(response)}")
+        else:
+            print(f"   ❌ Failed with status {response.status_code}")
+            try:
+                error_data = jloads(response)
+                print(f"   Error details: {jdumps(error_data)}")
+            except:
+                print(f"   Raw response: {response.text}")
+                
+    except Exception as e:
+        print(f"   ❌ Exception: {e}")
+    
+    # Test with comment
+    print("\n5. Testing with comment only...")
+    data = {
+        'network': cidr,
+        'network_view': network_view,
+        'comment': 'Test network creation'
+    }
+    
+    try:
+        response = session.post(f"{base_url}/network", json=data)
+        if response.status_code == 201:
+            print("   ✅ Works with comment")
+        else:
+            print(f"   ❌ Failed with comment: {response.status_code}")
+    except:
+        pass
+
+
+def main():
+    """Main function"""
+    load_dotenv('config.env')
+    
+    # Get configuration
+    grid_master = os.getenv('GRID_MASTER')
+    username = os.getenv('INFOBLOX_USERNAME')
+    password = os.getenv('PASSWORD')
+    network_view = os.getenv('NETWORK_VIEW', 'default')
+    
+    if not all([grid_master, username, password]):
+        print("❌ Missing configuration. Please check config.env")
+        return 1
+    
+    # Test specific network or read from rejected CSV
+    if len(sys.argv) > 1:
+        # Test specific CIDR
+        cidr = sys.argv[1]
+        if len(sys.argv) > 2:
+            network_view = sys.argv[2]
+        
+        test_network_creation(cidr, network_view, grid_master, username, password)
+    else:
+        # Look for most recent rejected networks CSV
+        import glob
+        csv_files = sorted(glob.glob('rejected_networks_*.csv'), reverse=True)
+        
+        if not csv_files:
+            print("No rejected networks CSV found.")
+            print("\nUsage:")
+            print("  python debug_network_creation.py <CIDR> [network_view]")
+            print("  python debug_network_creation.py  # to test from rejected CSV")
+            return 1
+        
+        print(f"Reading from: {csv_files[0]}")
+        # pandas is only needed on this CSV path - import it lazily so the
+        # common explicit-CIDR invocation starts without the import cost
+        import pandas as pd
+        # Only the first three CIDRs are tested, so keep the read minimal:
+        # nrows stops the parser after three records regardless of file size
+        df = pd.read_csv(csv_files[0], usecols=['CIDR'], nrows=3, dtype={'CIDR': 'string'})
+
+        # Test first few rejected networks
+        for cidr in df['CIDR'].tolist():
+            test_network_creation(cidr, network_view, grid_master, username, password)
+            print("\n" + "="*80 + "\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,14 +7,71 @@ to understand why networks might not be found in a specific view.
 """
 
 import requests
+import socket
 import urllib3
 import json
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 import os
 import getpass
 
+# Optional fast JSON decoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+
+def jloads(response):
+    """Decode a WAPI response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def make_session(username, password):
+    """Build an HTTP client for the Grid Master.
+
+    Prefers httpx with HTTP/2 (request multiplexing over one TLS
+    connection); falls back to a pooled requests.Session with
+    keep-alive and retry/backoff.
+    """
+    try:
+        import httpx
+        return httpx.Client(auth=(username, password), verify=False, http2=True,
+                            limits=httpx.Limits(max_connections=32,
+                                                max_keepalive_connections=32))
+    except ImportError:
+        pass
+    session = requests.Session()
+    session.auth = (username, password)
+    session.verify = False
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32,
+                          max_retries=Retry(total=3, backoff_factor=0.3,
+                                            status_forcelist=[502, 503, 504]))
+    session.mount('https://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+
+def pin_grid_master(session, grid_master):
+    """Resolve the Grid Master once and pin the IP to skip per-connect DNS.
+
+    Returns the host to use in URLs; the original hostname is kept in the
+    Host header (cert checks are disabled in these diagnostics anyway).
+    """
+    try:
+        ip = socket.gethostbyname(grid_master)
+    except (socket.gaierror, OSError):
+        return grid_master
+    if ip != grid_master:
+        session.headers['Host'] = grid_master
+    return ip
+
 def get_config():
     """Load configuration from environment or prompt user"""
     load_dotenv('config.env')
@@ -38,26 +95,29 @@ def get_config():
 def test_network_view_contents(grid_master, username, password, network_view):
     """Test what's actually in the network view"""
     
-    session = requests.Session()
-    session.auth = (username, password)
-    session.verify = False
-    
+    session = make_session(username, password)
+    grid_master = pin_grid_master(session, grid_master)
+
     print(f"\n🔍 Analyzing Network View: {network_view}")
     print("=" * 60)
     
-    # 1. Test if we can get all networks in the view
+    # 1. Test if we can get all networks in the view (single bulk query,
+    # reused below for the specific lookups instead of one GET per network)
+    existing_networks = None
     try:
         url = f"https://{grid_master}/wapi/v2.13.1/network"
         params = {
             'network_view': network_view,
-            '_return_fields': 'network,comment,extattrs'
+            '_return_fields': 'network,comment,extattrs',
+            '_max_results': 10000
         }
-        
+
         print(f"🔍 Querying all networks in view '{network_view}'...")
         response = session.get(url, params=params)
-        
+
         if response.status_code == 200:
-            networks = response.json()
+            networks = jloads(response)
+            existing_networks = {net.get('network') for net in networks}
             print(f"✅ Found {len(networks)} networks in view '{network_view}'")
             
             if networks:
@@ -86,40 +146,49 @@ def test_network_view_contents(grid_master, username, password, network_view):
     ]
     
     print(f"\n🔍 Testing specific network lookups...")
-    for test_network in test_networks:
-        try:
-            url = f"https://{grid_master}/wapi/v2.13.1/network"
-            params = {
-                'network': test_network,
-                'network_view': network_view,
-                '_return_fields': 'network,comment,extattrs'
-            }
-            
+    if existing_networks is not None:
+        # Membership test against the bulk listing - no extra round trips
+        for test_network in test_networks:
             print(f"   Searching for: {test_network}")
-            response = session.get(url, params=params)
-            
-            if response.status_code == 200:
-                networks = response.json()
-                if networks:
-                    print(f"   ✅ Found: {networks[0].get('network')}")
-                else:
-                    print(f"   🔍 Not found (empty result - this is normal if network doesn't exist)")
-            elif response.status_code == 400:
-                print(f"   ⚠️  400 Bad Request - this suggests an API query issue")
-                print(f"   Response: {response.text}")
+            if test_network in existing_networks:
+                print(f"   ✅ Found: {test_network}")
             else:
-                print(f"   ❌ Error {response.status_code}: {response.text}")
-                
-        except Exception as e:
-            print(f"   ❌ Exception: {e}")
+                print(f"   🔍 Not found (empty result - this is normal if network doesn't exist)")
+    else:
+        # Bulk listing failed - fall back to per-network queries
+        for test_network in test_networks:
+            try:
+                url = f"https://{grid_master}/wapi/v2.13.1/network"
+                params = {
+                    'network': test_network,
+                    'network_view': network_view,
+                    '_return_fields': 'network,comment,extattrs'
+                }
+
+                print(f"   Searching for: {test_network}")
+                response = session.get(url, params=params)
+
+                if response.status_code == 200:
+                    networks = jloads(response)
+                    if networks:
+                        print(f"   ✅ Found: {networks[0].get('network')}")
+                    else:
+                        print(f"   🔍 Not found (empty result - this is normal if network doesn't exist)")
+                elif response.status_code == 400:
+                    print(f"   ⚠️  400 Bad Request - this suggests an API query issue")
+                    print(f"   Response: {response.text}")
+                else:
+                    print(f"   ❌ Error {response.status_code}: {response.text}")
+
+            except Exception as e:
+                print(f"   ❌ Exception: {e}")
 
 def test_network_views(grid_master, username, password):
     """Test and display all available network views"""
     
-    session = requests.Session()
-    session.auth = (username, password)
-    session.verify = False
-    
+    session = make_session(username, password)
+    grid_master = pin_grid_master(session, grid_master)
+
     print(f"\n🔍 Available Network Views:")
     print("=" * 40)
     
@@ -128,27 +197,30 @@ def test_network_views(grid_master, username, password):
         response = session.get(url)
         
         if response.status_code == 200:
-            views = response.json()
+            views = jloads(response)
             print(f"✅ Found {len(views)} network views:")
-            
-            for i, view in enumerate(views):
-                view_name = view.get('name', 'Unknown')
-                print(f"  {i+1}. {view_name}")
-                
-                # Test network count in this view
+
+            # Count networks in every view concurrently - the per-view GETs
+            # carry no data dependency, so the whole pass costs ~1 RTT
+            def count_networks(view_name):
                 try:
                     net_url = f"https://{grid_master}/wapi/v2.13.1/network"
                     net_params = {'network_view': view_name, '_return_fields': 'network'}
                     net_response = session.get(net_url, params=net_params)
-                    
+
                     if net_response.status_code == 200:
-                        network_count = len(net_response.json())
-                        print(f"      Networks: {network_count}")
-                    else:
-                        print(f"      Networks: Error {net_response.status_code}")
-                        
+                        return str(len(jloads(net_response)))
+                    return f"Error {net_response.status_code}"
                 except Exception as e:
-                    print(f"      Networks: Error - {e}")
+                    return f"Error - {e}"
+
+            view_names = [view.get('name', 'Unknown') for view in views]
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                counts = list(executor.map(count_networks, view_names))
+
+            for i, (view_name, count) in enumerate(zip(view_names, counts)):
+                print(f"  {i+1}. {view_name}")
+                print(f"      Networks: {count}")
                     
         else:
             print(f"❌ Error getting views: {response.status_code}")
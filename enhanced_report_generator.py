@@ -12,859 +12,1043 @@ Author: Generated for AWS-InfoBlox Integration
 Date: June 4, 2025
 """
 
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain, islice
+from operator import itemgetter
 from typing import Dict, List, Any, Optional
+import heapq
 import json
 import os
 
+# Optional fast JSON serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Pre-baked %-templates for the hot table-row loops; constant templates
+# format measurably faster than re-parsing an f-string per row
+_MATCH_ROW = "| %d | %s | `%s` | %s | %s | %s | %s | ✅ Synced |\n"
+_MISSING_ROW = "| %d | %s | `%s` | %s | %s | %s | %s | 🔴 Create Network |\n"
+_DISC_ROW = "| %d | %s | `%s` | Tag Mismatch | Various | Various | 🟡 Update EAs |\n"
+_ERROR_ROW = "| %d | %s | %s | %s... | 🔍 Manual Review |\n"
+_CREATE_ROW = "| %s | `%s` | %s | %s | %s | %s | %s |\n"
+# Bound .format methods so the EA tables render via map() at C speed
+_EA_REQUIRED_ROW = "| `{}` | {} | STRING | AWS Tag Mapping |\n".format
+_EA_MISSING_ROW = "| `{}` | STRING | {} | ❌ Missing |\n".format
+
+# Shared fallback for rows without tags - dict.get('aws_tags', {}) builds a
+# fresh empty dict per miss, which adds up over thousands of table rows
+_EMPTY_TAGS: dict = {}
+
+# Static section headers, built once at import instead of per report
+_MATCH_HEADER = (
+    "### ✅ Matching Networks\n"
+    "> Networks that are properly synchronized between AWS and InfoBlox\n"
+    "\n"
+    "| # | VPC Name | CIDR Block | Account ID | Region | Environment | Owner | Status |\n"
+    "|---|----------|------------|------------|---------|-------------|-------|--------|\n")
+_MISSING_HEADER = (
+    "### 🔴 Missing Networks in InfoBlox\n"
+    "> AWS VPCs that need to be created in InfoBlox\n"
+    "\n"
+    "| # | VPC Name | CIDR Block | Account ID | Region | Environment | Project | Action Required |\n"
+    "|---|----------|------------|------------|---------|-------------|---------|-----------------|\n")
+_DISC_HEADER = (
+    "### 🟡 Networks with Tag/EA Discrepancies\n"
+    "> Networks that exist in both systems but have different tags/Extended Attributes\n"
+    "\n"
+    "| # | VPC Name | CIDR Block | Discrepancy Type | AWS Value | InfoBlox Value | Action |\n"
+    "|---|----------|------------|------------------|-----------|----------------|--------|\n")
+_ERROR_HEADER = (
+    "### ❌ Processing Errors\n"
+    "> VPCs that encountered errors during comparison\n"
+    "\n"
+    "| # | VPC ID | VPC Name | Error Message | Suggested Action |\n"
+    "|---|--------|----------|---------------|------------------|\n")
+_CREATED_HEADER = (
+    "#### Successfully Created Networks:\n"
+    "\n"
+    "| # | Network CIDR | Comment | Status |\n"
+    "|---|--------------|---------|--------|\n")
+_FAILED_HEADER = (
+    "#### Failed Creation Attempts:\n"
+    "\n"
+    "| # | Network CIDR | Error Message | Action Required |\n"
+    "|---|--------------|---------------|-----------------|\n")
+_OPS_TABLE_HEADER = (
+    "## 🔧 Operations Performed\n"
+    "\n"
+    "| Operation | Attempted | Successful | Failed |\n"
+    "|-----------|-----------|------------|--------|\n")
+
+# Recommendation/action blocks - only the counts vary per run
+_REC_MISSING_TMPL = (
+    "### 1. Create Missing Networks\n"
+    "- **Count**: %d networks\n"
+    "- **Priority**: High\n"
+    "- **Action**: Run the create command shown above\n\n")
+_REC_DISC_TMPL = (
+    "### 2. Update Discrepant Networks\n"
+    "- **Count**: %d networks\n"
+    "- **Priority**: Medium\n"
+    "- **Action**: Review tag differences and update as needed\n\n")
+_REC_ERROR_TMPL = (
+    "### 3. Resolve Processing Errors\n"
+    "- **Count**: %d errors\n"
+    "- **Priority**: High\n"
+    "- **Action**: Review error messages and resolve issues\n\n")
+_NO_ACTION_LINE = "✅ **No action required** - All VPCs are fully synchronized\n"
+_ACTION_MISSING_TMPL = "1. **Create %d missing networks in InfoBlox**\n"
+_ACTION_DISC_TMPL = "2. **Update %d networks with tag discrepancies**\n"
+_ACTION_ERROR_TMPL = "3. **Investigate and resolve %d processing errors**\n"
+
+# Static EA-report blocks, built once at import
+_EA_REQUIRED_TABLE_HEADER = """
+## 📋 Complete List of Required Extended Attributes
+
+| EA Name | Description | Data Type | Purpose |
+|---------|-------------|-----------|---------|
+"""
+_EA_CREATE_COMMANDS_TMPL = """
+#### 🚀 Automatic Creation Commands:
+
+**Option 1: Automatic Creation (Recommended)**
+```bash
+# This will automatically create all missing EAs before creating networks:
+python aws_infoblox_vpc_manager.py --create-missing
+```
+
+**Option 2: Manual Creation in InfoBlox GUI**
+1. Log into InfoBlox Grid Manager
+2. Navigate to Administration → Extensible Attributes
+3. Click 'Add' and create each EA with these settings:
+   - **Data Type**: STRING
+   - **Default Value**: (leave empty)
+   - **Comment**: Use descriptions from table above
+
+**⚠️ Important**: All %d Extended Attributes must be created before network creation will succeed.
+"""
+_EA_BEST_PRACTICES = """
+## 📚 Extended Attributes Best Practices
+
+### Naming Convention
+- Use lowercase with underscores: `aws_vpc_id`
+- Prefix AWS-specific attributes with `aws_`
+- Keep names descriptive but concise
+
+### Data Types
+- Use STRING for most AWS tag values
+- Consider ENUM for standardized values (environments)
+- Use appropriate length limits for values
+
+### Maintenance
+- Regularly review unused Extended Attributes
+- Document the purpose of each attribute
+- Consider archiving obsolete attributes
+
+---
+"""
+
+# Human-readable descriptions of the Extended Attributes used for AWS
+# tag mapping, shared by both tables in the EA report
+_EA_DESCRIPTIONS = {
+    'aws_name': 'AWS VPC Name',
+    'environment': 'Environment (prod/staging/test/dev)',
+    'owner': 'Resource Owner',
+    'project': 'Project Name',
+    'aws_location': 'AWS Region/Location',
+    'aws_cloudservice': 'AWS Cloud Service Type',
+    'aws_created_by': 'Created By User',
+    'aws_requested_by': 'Requested By User',
+    'aws_dud': 'DUD Number',
+    'aws_account_id': 'AWS Account ID',
+    'aws_region': 'AWS Region',
+    'aws_vpc_id': 'AWS VPC ID',
+    'description': 'VPC Description',
+    'aws_tfc_created': 'Terraform Cloud Created Flag',
+    'aws_tfe_created': 'Terraform Enterprise Created Flag'
+}
+
+
+@dataclass
+class _ReportContext:
+    """Shared aggregates over the comparison results, computed once per run"""
+    total: int
+    n_match: int
+    n_miss: int
+    n_disc: int
+    n_err: int
+    sync_pct: float
+    tag_stats: Dict[str, Dict]
+    region_dist: Counter
+    env_dist: Counter
+
 
 class EnhancedReportGenerator:
     """Generate multiple types of detailed reports for VPC operations"""
-    
-    def __init__(self, output_dir: str = "reports"):
-        """Initialize report generator with output directory"""
+
+    # Index entry descriptions, keyed by report type
+    _REPORT_DESCRIPTIONS = {
+        'executive': '📊 Executive Summary - High-level overview and metrics',
+        'comparison': '🔍 Detailed Comparison Report - Full VPC comparison analysis',
+        'tag_analysis': '🏷️ Tag Analysis Report - AWS tag usage and compliance',
+        'network_creation': '📋 Network Creation List - Prioritized list of networks to create',
+        'extended_attributes': '🏷️ Extended Attributes Report - EA analysis and status',
+        'operations': '🚀 Operation Results - Results of create/update operations'
+    }
+
+
+    def __init__(self, output_dir: str = "reports", max_table_rows: int = 500,
+                 emit_json: bool = True, emit_markdown: bool = True):
+        """Initialize report generator with output directory.
+
+        max_table_rows bounds the detail tables in the comparison report;
+        pass 0 (or None) to always emit every row. emit_json also dumps the
+        raw result payloads as .json files for downstream tooling;
+        emit_markdown=False skips the markdown reports entirely.
+        """
         self.output_dir = output_dir
+        self.max_table_rows = max_table_rows
+        self.emit_json = emit_json
+        self.emit_markdown = emit_markdown
         self.timestamp = datetime.now()
         self.timestamp_str = self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
         self.date_str = self.timestamp.strftime("%Y-%m-%d")
+        self.long_date_str = self.timestamp.strftime("%B %d, %Y")
+        self.file_timestamp_str = self.timestamp.strftime("%Y%m%d_%H%M%S")
+        # Last (comparison_results, context) pair, so back-to-back builder
+        # calls on the same results reuse one aggregation pass
+        self._ctx_cache: Optional[tuple] = None
+        # Same identity-pair pattern for the sorted required-EA names
+        self._ea_sorted_cache: Optional[tuple] = None
         
         # Create reports directory if it doesn't exist
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-    
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def _dated_path(self, stem: str, ext: str = "md") -> str:
+        """Path of a dated report file inside the output directory"""
+        return f"{self.output_dir}/{stem}_{self.date_str}.{ext}"
+
+    def _truncated(self, items: List) -> tuple:
+        """Bound a detail table to max_table_rows rows.
+
+        Returns (rows, remaining) where remaining is how many rows were
+        cut off (0 when the table fits or truncation is disabled).
+        """
+        limit = self.max_table_rows
+        if not limit or len(items) <= limit:
+            return items, 0
+        return islice(items, limit), len(items) - limit
+
+    def _write_json(self, filename: str, payload: Any) -> None:
+        """Dump a payload as JSON in one binary write, using orjson when available"""
+        if orjson is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=str)
+        else:
+            data = json.dumps(payload, indent=2, default=str).encode('utf-8')
+        with open(filename, 'wb', buffering=0) as f:
+            f.write(data)
+
+    def _ctx_for(self, comparison_results: Dict,
+                 ctx: Optional[_ReportContext] = None) -> _ReportContext:
+        """Return a context for comparison_results, reusing the cached one.
+
+        The cache keys on the results object itself (identity, not id(),
+        so a recycled address can never alias a stale entry).
+        """
+        if ctx is not None:
+            return ctx
+        cached = self._ctx_cache
+        if cached is not None and cached[0] is comparison_results:
+            return cached[1]
+        ctx = self._build_ctx(comparison_results)
+        self._ctx_cache = (comparison_results, ctx)
+        return ctx
+
+    def _build_ctx(self, comparison_results: Dict) -> _ReportContext:
+        """Compute the shared report aggregates in a single pass.
+
+        Several builders need the same totals, tag statistics and
+        region/environment distributions; building them once here means
+        generate_all_reports walks the comparison buckets once instead of
+        once per report.
+        """
+        n_match = len(comparison_results.get('matches', []))
+        n_miss = len(comparison_results.get('missing', []))
+        n_disc = len(comparison_results.get('discrepancies', []))
+        n_err = len(comparison_results.get('errors', []))
+        total = n_match + n_miss + n_disc + n_err
+
+        region_dist = Counter()
+        env_dist = Counter()
+        counts = Counter()
+        values = defaultdict(set)
+        value_counts = defaultdict(Counter)
+
+        items = chain(comparison_results.get('matches', ()),
+                      comparison_results.get('missing', ()),
+                      comparison_results.get('discrepancies', ()))
+        for item in items:
+            # EAFP: the keys are present on virtually every row, and a
+            # plain subscript beats .get with a default when they are
+            try:
+                region = item['vpc']['Region']
+            except KeyError:
+                region = 'Unknown'
+            region_dist[region] += 1
+            aws_tags = item.get('aws_tags') or _EMPTY_TAGS
+            try:
+                env = aws_tags['environment']
+            except KeyError:
+                env = 'Unknown'
+            env_dist[env] += 1
+            for tag_name, tag_value in aws_tags.items():
+                counts[tag_name] += 1
+                # Stringify once per value; only copy when the 50-char
+                # display limit actually truncates
+                value_key = tag_value if type(tag_value) is str else str(tag_value)
+                values[tag_name].add(value_key if len(value_key) <= 50 else value_key[:50])
+                value_counts[tag_name][value_key] += 1
+
+        tag_stats = {tag_name: {'count': count,
+                                'values': values[tag_name],
+                                'value_counts': value_counts[tag_name]}
+                     for tag_name, count in counts.items()}
+
+        return _ReportContext(
+            total=total, n_match=n_match, n_miss=n_miss, n_disc=n_disc,
+            n_err=n_err,
+            sync_pct=(n_match / total * 100) if total > 0 else 0.0,
+            tag_stats=tag_stats, region_dist=region_dist, env_dist=env_dist)
+
+
     def generate_all_reports(self, comparison_results: Dict, operation_results: Optional[Dict] = None, 
                            network_view: str = "default", network_creation_list: Optional[Dict] = None,
                            ea_analysis: Optional[Dict] = None) -> Dict[str, str]:
         """Generate all report types and return their filenames"""
-        reports = {}
-        
-        # Generate comparison report
-        reports['comparison'] = self.generate_comparison_report(comparison_results, network_view)
-        
-        # Generate executive summary
-        reports['executive'] = self.generate_executive_summary(comparison_results, operation_results, network_view)
-        
-        # Generate tag analysis report
-        reports['tag_analysis'] = self.generate_tag_analysis_report(comparison_results)
-        
-        # Generate network creation list report
-        if network_creation_list:
-            reports['network_creation'] = self.generate_network_creation_report(network_creation_list, network_view)
-        
-        # Generate extended attribute report
-        if ea_analysis:
-            reports['extended_attributes'] = self.generate_extended_attribute_report(ea_analysis)
-        
-        # Generate operation results report if operations were performed
-        if operation_results:
-            reports['operations'] = self.generate_operation_report(operation_results)
-        
-        # Generate master index file
+        reports: Dict[str, str] = {}
+
+        if self.emit_json:
+            # Raw payloads for machine consumers - no markdown synthesis
+            payloads = {'comparison': comparison_results,
+                        'operations': operation_results,
+                        'network_creation': network_creation_list,
+                        'extended_attributes': ea_analysis}
+            for name, payload in payloads.items():
+                if payload:
+                    json_file = self._dated_path(name, 'json')
+                    self._write_json(json_file, payload)
+                    reports[f"{name}_json"] = json_file
+
+        if not self.emit_markdown:
+            return reports
+
+        # Shared aggregates, computed once and handed to every builder
+        ctx = self._ctx_for(comparison_results)
+
+        # Task table in deterministic order; optional builders only run
+        # when their payload is present
+        tasks = [(name, builder, args) for name, builder, args, wanted in (
+            ('comparison', self.generate_comparison_report,
+             (comparison_results, network_view, ctx), True),
+            ('executive', self.generate_executive_summary,
+             (comparison_results, operation_results, network_view, ctx), True),
+            ('tag_analysis', self.generate_tag_analysis_report,
+             (comparison_results, ctx), True),
+            ('network_creation', self.generate_network_creation_report,
+             (network_creation_list, network_view), bool(network_creation_list)),
+            ('extended_attributes', self.generate_extended_attribute_report,
+             (ea_analysis,), bool(ea_analysis)),
+            ('operations', self.generate_operation_report,
+             (operation_results,), bool(operation_results)),
+        ) if wanted]
+
+        # The individual reports are independent (separate filenames), so
+        # build and write them concurrently
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [(name, executor.submit(builder, *args))
+                       for name, builder, args in tasks]
+            reports.update((name, future.result()) for name, future in futures)
+
+        # Generate master index file (depends on the reports above)
         reports['index'] = self.generate_index_report(reports)
-        
+
         return reports
     
-    def generate_comparison_report(self, comparison_results: Dict, network_view: str) -> str:
+    def generate_comparison_report(self, comparison_results: Dict, network_view: str,
+                                   ctx: Optional[_ReportContext] = None) -> str:
         """Generate detailed comparison report with enhanced formatting"""
-        filename = f"{self.output_dir}/vpc_comparison_report_{self.date_str}.md"
-        
-        report_lines = [
-            "# AWS VPC to InfoBlox Detailed Comparison Report",
-            f"*Generated on {self.timestamp_str}*",
-            "",
-            f"**Network View**: `{network_view}`",
-            "",
-            "---",
-            "",
-            "## 📊 Executive Summary",
-            "",
-            "### Overall Statistics",
-            f"- **Total VPCs Analyzed**: {self._get_total_vpcs(comparison_results)}",
-            f"- **✅ Matching Networks**: {len(comparison_results['matches'])}",
-            f"- **🔴 Missing Networks**: {len(comparison_results['missing'])}",
-            f"- **🟡 Networks with Discrepancies**: {len(comparison_results['discrepancies'])}",
-            f"- **❌ Processing Errors**: {len(comparison_results['errors'])}",
-            "",
-            "### Sync Status",
-            self._generate_sync_chart(comparison_results),
-            "",
-            "---",
-            "",
-            "## 📋 Detailed Analysis",
-            ""
-        ]
-        
-        # Matching networks section with enhanced details
-        if comparison_results['matches']:
-            report_lines.extend([
-                "### ✅ Matching Networks",
-                "> Networks that are properly synchronized between AWS and InfoBlox",
-                "",
-                "| # | VPC Name | CIDR Block | Account ID | Region | Environment | Owner | Status |",
-                "|---|----------|------------|------------|---------|-------------|-------|--------|"
-            ])
-            
-            for idx, match in enumerate(comparison_results['matches'], 1):
-                vpc = match['vpc']
-                aws_tags = match.get('aws_tags', {})
-                report_lines.append(
-                    f"| {idx} | {vpc['Name']} | `{match['cidr']}` | {vpc['AccountId']} | "
-                    f"{vpc['Region']} | {aws_tags.get('environment', 'N/A')} | "
-                    f"{aws_tags.get('owner', 'N/A')} | ✅ Synced |"
-                )
-            
-            report_lines.append("")
-        
-        # Missing networks section with action items
-        if comparison_results['missing']:
-            report_lines.extend([
-                "### 🔴 Missing Networks in InfoBlox",
-                "> AWS VPCs that need to be created in InfoBlox",
-                "",
-                "| # | VPC Name | CIDR Block | Account ID | Region | Environment | Project | Action Required |",
-                "|---|----------|------------|------------|---------|-------------|---------|-----------------|"
-            ])
-            
-            for idx, missing in enumerate(comparison_results['missing'], 1):
-                vpc = missing['vpc']
-                aws_tags = missing.get('aws_tags', {})
-                report_lines.append(
-                    f"| {idx} | {vpc['Name']} | `{missing['cidr']}` | {vpc['AccountId']} | "
-                    f"{vpc['Region']} | {aws_tags.get('environment', 'N/A')} | "
-                    f"{aws_tags.get('project', 'N/A')} | 🔴 Create Network |"
-                )
-            
-            report_lines.extend([
-                "",
-                "#### 🎯 Quick Actions for Missing Networks:",
-                "```bash",
-                f"# Create all missing networks (dry-run first)",
-                f"python aws_infoblox_vpc_manager.py --network-view {network_view} --create-missing --dry-run",
-                "",
-                f"# Create all missing networks (actual)",
-                f"python aws_infoblox_vpc_manager.py --network-view {network_view} --create-missing",
-                "```",
-                ""
-            ])
-        
-        # Discrepancies section with detailed differences
-        if comparison_results['discrepancies']:
-            report_lines.extend([
-                "### 🟡 Networks with Tag/EA Discrepancies",
-                "> Networks that exist in both systems but have different tags/Extended Attributes",
-                "",
-                "| # | VPC Name | CIDR Block | Discrepancy Type | AWS Value | InfoBlox Value | Action |",
-                "|---|----------|------------|------------------|-----------|----------------|--------|"
-            ])
-            
-            for idx, discrepancy in enumerate(comparison_results['discrepancies'], 1):
-                vpc = discrepancy['vpc']
+        filename = self._dated_path('vpc_comparison_report')
+
+        # Section counts and distributions, computed once for the whole report
+        ctx = self._ctx_for(comparison_results, ctx)
+        n_match, n_miss, n_disc, n_err = ctx.n_match, ctx.n_miss, ctx.n_disc, ctx.n_err
+        total = ctx.total
+
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20,
+                  newline='\n') as f:
+            w = f.write
+
+            w(f"""# AWS VPC to InfoBlox Detailed Comparison Report
+*Generated on {self.timestamp_str}*
+
+**Network View**: `{network_view}`
+
+---
+
+## 📊 Executive Summary
+
+### Overall Statistics
+- **Total VPCs Analyzed**: {total}
+- **✅ Matching Networks**: {n_match}
+- **🔴 Missing Networks**: {n_miss}
+- **🟡 Networks with Discrepancies**: {n_disc}
+- **❌ Processing Errors**: {n_err}
+
+### Sync Status
+{self._generate_sync_chart(ctx)}
+
+---
+
+## 📋 Detailed Analysis
+
+""")
+
+            # Matching networks section with enhanced details
+            if comparison_results['matches']:
+                w(_MATCH_HEADER)
+
+                rows, remaining = self._truncated(comparison_results['matches'])
+                # One C-level join instead of a Python-level append per row
+                w(''.join(
+                    _MATCH_ROW % (idx, vpc['Name'], match['cidr'], vpc['AccountId'],
+                                  vpc['Region'], aws_tags.get('environment', 'N/A'),
+                                  aws_tags.get('owner', 'N/A'))
+                    for idx, (match, vpc, aws_tags) in enumerate(
+                        ((m, m['vpc'], m.get('aws_tags') or _EMPTY_TAGS) for m in rows), 1)))
+                if remaining:
+                    w(f"\n*(+{remaining} more rows truncated)*\n")
+
+                w("\n")
+
+            # Missing networks section with action items
+            if comparison_results['missing']:
+                w(_MISSING_HEADER)
+
+                rows, remaining = self._truncated(comparison_results['missing'])
+                w(''.join(
+                    _MISSING_ROW % (idx, vpc['Name'], missing['cidr'], vpc['AccountId'],
+                                    vpc['Region'], aws_tags.get('environment', 'N/A'),
+                                    aws_tags.get('project', 'N/A'))
+                    for idx, (missing, vpc, aws_tags) in enumerate(
+                        ((m, m['vpc'], m.get('aws_tags') or _EMPTY_TAGS) for m in rows), 1)))
+                if remaining:
+                    w(f"\n*(+{remaining} more rows truncated)*\n")
+
+                w(f"""
+#### 🎯 Quick Actions for Missing Networks:
+```bash
+# Create all missing networks (dry-run first)
+python aws_infoblox_vpc_manager.py --network-view {network_view} --create-missing --dry-run
+
+# Create all missing networks (actual)
+python aws_infoblox_vpc_manager.py --network-view {network_view} --create-missing
+```
+
+""")
+
+            # Discrepancies section with detailed differences
+            if comparison_results['discrepancies']:
+                w(_DISC_HEADER)
+
+                rows, remaining = self._truncated(comparison_results['discrepancies'])
                 # Add logic to show specific tag differences
-                report_lines.append(
-                    f"| {idx} | {vpc['Name']} | `{discrepancy['cidr']}` | "
-                    f"Tag Mismatch | Various | Various | 🟡 Update EAs |"
-                )
-            
-            report_lines.append("")
-        
-        # Errors section
-        if comparison_results['errors']:
-            report_lines.extend([
-                "### ❌ Processing Errors",
-                "> VPCs that encountered errors during comparison",
-                "",
-                "| # | VPC ID | VPC Name | Error Message | Suggested Action |",
-                "|---|--------|----------|---------------|------------------|"
-            ])
-            
-            for idx, error in enumerate(comparison_results['errors'], 1):
-                vpc = error['vpc']
-                report_lines.append(
-                    f"| {idx} | {vpc.get('VpcId', 'Unknown')} | {vpc.get('Name', 'Unknown')} | "
-                    f"{error['error'][:50]}... | 🔍 Manual Review |"
-                )
-            
-            report_lines.append("")
-        
-        # Region distribution
-        report_lines.extend(self._generate_region_distribution(comparison_results))
-        
-        # Environment distribution
-        report_lines.extend(self._generate_environment_distribution(comparison_results))
-        
-        # Recommendations
-        report_lines.extend([
-            "",
-            "---",
-            "",
-            "## 📌 Recommendations",
-            ""
-        ])
-        
-        if comparison_results['missing']:
-            report_lines.extend([
-                "### 1. Create Missing Networks",
-                f"- **Count**: {len(comparison_results['missing'])} networks",
-                "- **Priority**: High",
-                "- **Action**: Run the create command shown above",
-                ""
-            ])
-        
-        if comparison_results['discrepancies']:
-            report_lines.extend([
-                "### 2. Update Discrepant Networks",
-                f"- **Count**: {len(comparison_results['discrepancies'])} networks",
-                "- **Priority**: Medium",
-                "- **Action**: Review tag differences and update as needed",
-                ""
-            ])
-        
-        if comparison_results['errors']:
-            report_lines.extend([
-                "### 3. Resolve Processing Errors",
-                f"- **Count**: {len(comparison_results['errors'])} errors",
-                "- **Priority**: High",
-                "- **Action**: Review error messages and resolve issues",
-                ""
-            ])
-        
-        # Footer
-        report_lines.extend([
-            "---",
-            "",
-            f"*Report generated by AWS-InfoBlox VPC Manager on {self.timestamp_str}*",
-            f"*Network View: {network_view}*"
-        ])
-        
-        # Write report
-        with open(filename, 'w') as f:
-            f.write('\n'.join(report_lines))
-        
+                w(''.join(_DISC_ROW % (idx, d['vpc']['Name'], d['cidr'])
+                          for idx, d in enumerate(rows, 1)))
+                if remaining:
+                    w(f"\n*(+{remaining} more rows truncated)*\n")
+
+                w("\n")
+
+            # Errors section
+            if comparison_results['errors']:
+                w(_ERROR_HEADER)
+
+                rows, remaining = self._truncated(comparison_results['errors'])
+                w(''.join(
+                    _ERROR_ROW % (idx, vpc.get('VpcId', 'Unknown'), vpc.get('Name', 'Unknown'),
+                                  error['error'][:50])
+                    for idx, (error, vpc) in enumerate(
+                        ((e, e['vpc']) for e in rows), 1)))
+                if remaining:
+                    w(f"\n*(+{remaining} more rows truncated)*\n")
+
+                w("\n")
+
+            # Region distribution
+            region_lines = self._generate_region_distribution(ctx.region_dist)
+            if region_lines:
+                w('\n'.join(region_lines))
+                w("\n")
+
+            # Environment distribution
+            env_lines = self._generate_environment_distribution(ctx.env_dist)
+            if env_lines:
+                w('\n'.join(env_lines))
+                w("\n")
+
+            # Recommendations
+            w("\n---\n\n## 📌 Recommendations\n\n")
+
+            if n_miss:
+                w(_REC_MISSING_TMPL % n_miss)
+
+            if n_disc:
+                w(_REC_DISC_TMPL % n_disc)
+
+            if n_err:
+                w(_REC_ERROR_TMPL % n_err)
+
+            if not (n_miss or n_disc or n_err):
+                w(_NO_ACTION_LINE)
+
+            # Footer
+            w(f"""---
+
+*Report generated by AWS-InfoBlox VPC Manager on {self.timestamp_str}*
+*Network View: {network_view}*""")
+
+
         return filename
     
-    def generate_executive_summary(self, comparison_results: Dict, 
-                                 operation_results: Optional[Dict] = None, network_view: str = "default") -> str:
+    def generate_executive_summary(self, comparison_results: Dict,
+                                 operation_results: Optional[Dict] = None, network_view: str = "default",
+                                 ctx: Optional[_ReportContext] = None) -> str:
         """Generate executive summary report"""
-        filename = f"{self.output_dir}/executive_summary_{self.date_str}.md"
-        
-        total_vpcs = self._get_total_vpcs(comparison_results)
-        sync_percentage = (len(comparison_results['matches']) / total_vpcs * 100) if total_vpcs > 0 else 0
-        
-        report_lines = [
-            "# Executive Summary - AWS to InfoBlox VPC Synchronization",
-            f"*Report Date: {self.timestamp.strftime('%B %d, %Y')}*",
-            "",
-            "## 🎯 Key Metrics",
-            "",
-            f"### Overall Synchronization Status: {sync_percentage:.1f}%",
-            "",
-            "| Metric | Count | Percentage |",
-            "|--------|-------|------------|",
-            f"| Total AWS VPCs | {total_vpcs} | 100% |",
-            f"| ✅ Synchronized | {len(comparison_results['matches'])} | {len(comparison_results['matches'])/total_vpcs*100:.1f}% |",
-            f"| 🔴 Missing in InfoBlox | {len(comparison_results['missing'])} | {len(comparison_results['missing'])/total_vpcs*100:.1f}% |",
-            f"| 🟡 Tag Discrepancies | {len(comparison_results['discrepancies'])} | {len(comparison_results['discrepancies'])/total_vpcs*100:.1f}% |",
-            f"| ❌ Processing Errors | {len(comparison_results['errors'])} | {len(comparison_results['errors'])/total_vpcs*100:.1f}% |",
-            "",
-        ]
-        
-        # Add operation results if available
-        if operation_results:
-            report_lines.extend([
-                "## 🔧 Operations Performed",
-                "",
-                "| Operation | Attempted | Successful | Failed |",
-                "|-----------|-----------|------------|--------|"
-            ])
-            
-            if 'create' in operation_results:
-                create_stats = self._calculate_operation_stats(operation_results['create'])
-                report_lines.append(
-                    f"| Network Creation | {create_stats['total']} | "
-                    f"{create_stats['success']} | {create_stats['failed']} |"
-                )
-            
-            if 'update' in operation_results:
-                update_stats = self._calculate_operation_stats(operation_results['update'])
-                report_lines.append(
-                    f"| Network Updates | {update_stats['total']} | "
-                    f"{update_stats['success']} | {update_stats['failed']} |"
-                )
-            
-            report_lines.append("")
-        
-        # Action items
-        report_lines.extend([
-            "## 📋 Action Items",
-            ""
-        ])
-        
-        if comparison_results['missing']:
-            report_lines.append(f"1. **Create {len(comparison_results['missing'])} missing networks in InfoBlox**")
-        
-        if comparison_results['discrepancies']:
-            report_lines.append(f"2. **Update {len(comparison_results['discrepancies'])} networks with tag discrepancies**")
-        
-        if comparison_results['errors']:
-            report_lines.append(f"3. **Investigate and resolve {len(comparison_results['errors'])} processing errors**")
-        
-        if not any([comparison_results['missing'], comparison_results['discrepancies'], comparison_results['errors']]):
-            report_lines.append("✅ **No action required** - All VPCs are fully synchronized")
-        
-        # Summary
-        report_lines.extend([
-            "",
-            "## 📈 Trend Analysis",
-            "",
-            "| Time Period | Status |",
-            "|-------------|---------|",
-            f"| Current Sync Rate | {sync_percentage:.1f}% |",
-            f"| Networks Requiring Action | {len(comparison_results['missing']) + len(comparison_results['discrepancies'])} |",
-            f"| Critical Issues | {len(comparison_results['errors'])} |",
-            "",
-            "---",
-            f"*Executive Summary generated on {self.timestamp_str}*"
-        ])
-        
-        with open(filename, 'w') as f:
-            f.write('\n'.join(report_lines))
-        
+        filename = self._dated_path('executive_summary')
+
+        ctx = self._ctx_for(comparison_results, ctx)
+        n_match, n_miss, n_disc, n_err = ctx.n_match, ctx.n_miss, ctx.n_disc, ctx.n_err
+        total_vpcs = ctx.total
+        # Percentage factor, computed once (also avoids dividing by zero
+        # when no VPCs were analyzed)
+        inv = 100.0 / total_vpcs if total_vpcs > 0 else 0.0
+        sync_percentage = ctx.sync_pct
+
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20,
+                  newline='\n') as f:
+            w = f.write
+
+            w(f"""# Executive Summary - AWS to InfoBlox VPC Synchronization
+*Report Date: {self.long_date_str}*
+
+## 🎯 Key Metrics
+
+### Overall Synchronization Status: {sync_percentage:.1f}%
+
+| Metric | Count | Percentage |
+|--------|-------|------------|
+| Total AWS VPCs | {total_vpcs} | 100% |
+| ✅ Synchronized | {n_match} | {n_match * inv:.1f}% |
+| 🔴 Missing in InfoBlox | {n_miss} | {n_miss * inv:.1f}% |
+| 🟡 Tag Discrepancies | {n_disc} | {n_disc * inv:.1f}% |
+| ❌ Processing Errors | {n_err} | {n_err * inv:.1f}% |
+
+""")
+
+            # Add operation results if available
+            if operation_results:
+                w(_OPS_TABLE_HEADER)
+
+                if 'create' in operation_results:
+                    create_stats = self._calculate_operation_stats(operation_results['create'])
+                    w(f"| Network Creation | {create_stats['total']} | "
+                      f"{create_stats['success']} | {create_stats['failed']} |\n")
+
+                if 'update' in operation_results:
+                    update_stats = self._calculate_operation_stats(operation_results['update'])
+                    w(f"| Network Updates | {update_stats['total']} | "
+                      f"{update_stats['success']} | {update_stats['failed']} |\n")
+
+                w("\n")
+
+            # Action items
+            w("## 📋 Action Items\n\n")
+
+            if n_miss:
+                w(_ACTION_MISSING_TMPL % n_miss)
+
+            if n_disc:
+                w(_ACTION_DISC_TMPL % n_disc)
+
+            if n_err:
+                w(_ACTION_ERROR_TMPL % n_err)
+
+            if not (n_miss or n_disc or n_err):
+                w(_NO_ACTION_LINE)
+
+            # Summary
+            w(f"""
+## 📈 Trend Analysis
+
+| Time Period | Status |
+|-------------|---------|
+| Current Sync Rate | {sync_percentage:.1f}% |
+| Networks Requiring Action | {n_miss + n_disc} |
+| Critical Issues | {n_err} |
+
+---
+*Executive Summary generated on {self.timestamp_str}*""")
+
+
         return filename
     
-    def generate_tag_analysis_report(self, comparison_results: Dict) -> str:
+    def generate_tag_analysis_report(self, comparison_results: Dict,
+                                     ctx: Optional[_ReportContext] = None) -> str:
         """Generate detailed tag analysis report"""
-        filename = f"{self.output_dir}/tag_analysis_report_{self.date_str}.md"
-        
-        # Analyze tag usage across all VPCs
-        tag_stats = self._analyze_tags(comparison_results)
-        
-        report_lines = [
-            "# AWS VPC Tag Analysis Report",
-            f"*Generated on {self.timestamp_str}*",
-            "",
-            "## 📊 Tag Usage Statistics",
-            "",
-            "### Most Common Tags",
-            "",
-            "| Tag Name | Usage Count | Percentage | Common Values |",
-            "|----------|-------------|------------|---------------|"
-        ]
-        
-        # Sort tags by usage
-        sorted_tags = sorted(tag_stats.items(), key=lambda x: x[1]['count'], reverse=True)[:20]
-        
-        for tag_name, stats in sorted_tags:
-            usage_pct = stats['count'] / self._get_total_vpcs(comparison_results) * 100
-            common_values = ', '.join(list(stats['values'])[:3])
-            if len(stats['values']) > 3:
-                common_values += f" (+{len(stats['values']) - 3} more)"
-            
-            report_lines.append(
-                f"| {tag_name} | {stats['count']} | {usage_pct:.1f}% | {common_values} |"
-            )
-        
-        # Tag compliance
-        report_lines.extend([
-            "",
-            "## 🏷️ Tag Compliance Analysis",
-            "",
-            "### Required Tags Coverage",
-            "",
-            "| Required Tag | Coverage | Missing From |",
-            "|--------------|----------|--------------|"
-        ])
-        
-        required_tags = ['Name', 'environment', 'owner', 'project']
-        for tag in required_tags:
-            if tag in tag_stats:
-                coverage = tag_stats[tag]['count'] / self._get_total_vpcs(comparison_results) * 100
-                missing = self._get_total_vpcs(comparison_results) - tag_stats[tag]['count']
-                report_lines.append(f"| {tag} | {coverage:.1f}% | {missing} VPCs |")
-            else:
-                report_lines.append(f"| {tag} | 0% | All VPCs |")
-        
-        # Environment distribution
-        report_lines.extend([
-            "",
-            "## 🌍 Environment Distribution",
-            "",
-            "| Environment | VPC Count | Percentage |",
-            "|-------------|-----------|------------|"
-        ])
-        
-        if 'environment' in tag_stats:
-            env_total = sum(tag_stats['environment']['value_counts'].values())
-            for env, count in sorted(tag_stats['environment']['value_counts'].items(), 
-                                    key=lambda x: x[1], reverse=True):
-                pct = count / env_total * 100
-                report_lines.append(f"| {env} | {count} | {pct:.1f}% |")
-        
-        report_lines.extend([
-            "",
-            "---",
-            f"*Tag Analysis Report generated on {self.timestamp_str}*"
-        ])
-        
-        with open(filename, 'w') as f:
-            f.write('\n'.join(report_lines))
-        
+        filename = self._dated_path('tag_analysis_report')
+
+        ctx = self._ctx_for(comparison_results, ctx)
+
+        # Tag usage across all VPCs, from the shared context
+        tag_stats = ctx.tag_stats
+
+        # Total and percentage factor, hoisted out of the per-tag loops
+        total = ctx.total
+        inv = 100.0 / total if total > 0 else 0.0
+
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20,
+                  newline='\n') as f:
+            w = f.write
+
+            w(f"""# AWS VPC Tag Analysis Report
+*Generated on {self.timestamp_str}*
+
+## 📊 Tag Usage Statistics
+
+### Most Common Tags
+
+| Tag Name | Usage Count | Percentage | Common Values |
+|----------|-------------|------------|---------------|
+""")
+
+            # Top 20 tags by usage - O(T log 20) instead of a full sort
+            sorted_tags = heapq.nlargest(20, tag_stats.items(), key=lambda x: x[1]['count'])
+
+            for tag_name, stats in sorted_tags:
+                usage_pct = stats['count'] * inv
+                # Sample three values without copying the whole set
+                values = stats['values']
+                common_values = ', '.join(islice(values, 3))
+                extra = len(values) - 3
+                if extra > 0:
+                    common_values += f" (+{extra} more)"
+
+                w(f"| {tag_name} | {stats['count']} | {usage_pct:.1f}% | {common_values} |\n")
+
+            # Tag compliance
+            w("""
+## 🏷️ Tag Compliance Analysis
+
+### Required Tags Coverage
+
+| Required Tag | Coverage | Missing From |
+|--------------|----------|--------------|
+""")
+
+            required_tags = ['Name', 'environment', 'owner', 'project']
+            for tag in required_tags:
+                if tag in tag_stats:
+                    coverage = tag_stats[tag]['count'] * inv
+                    missing = total - tag_stats[tag]['count']
+                    w(f"| {tag} | {coverage:.1f}% | {missing} VPCs |\n")
+                else:
+                    w(f"| {tag} | 0% | All VPCs |\n")
+
+            # Environment distribution
+            w("""
+## 🌍 Environment Distribution
+
+| Environment | VPC Count | Percentage |
+|-------------|-----------|------------|
+""")
+
+            if 'environment' in tag_stats:
+                env_total = sum(tag_stats['environment']['value_counts'].values())
+                for env, count in sorted(tag_stats['environment']['value_counts'].items(),
+                                        key=itemgetter(1), reverse=True):
+                    pct = count / env_total * 100
+                    w(f"| {env} | {count} | {pct:.1f}% |\n")
+
+            w(f"""
+---
+*Tag Analysis Report generated on {self.timestamp_str}*""")
+
+
         return filename
     
     def generate_operation_report(self, operation_results: Dict) -> str:
         """Generate detailed operation results report"""
-        filename = f"{self.output_dir}/operation_results_{self.timestamp.strftime('%Y%m%d_%H%M%S')}.md"
+        filename = f"{self.output_dir}/operation_results_{self.file_timestamp_str}.md"
         
-        report_lines = [
-            "# InfoBlox Operation Results Report",
-            f"*Executed on {self.timestamp_str}*",
-            "",
-            "## 🚀 Operation Summary",
-            ""
-        ]
-        
-        # Create operations
-        if 'create' in operation_results:
-            create_results = operation_results['create']
-            create_stats = self._calculate_operation_stats(create_results)
-            
-            report_lines.extend([
-                "### Network Creation Operations",
-                "",
-                f"- **Total Attempted**: {create_stats['total']}",
-                f"- **✅ Successful**: {create_stats['success']}",
-                f"- **❌ Failed**: {create_stats['failed']}",
-                f"- **Success Rate**: {create_stats['success_rate']:.1f}%",
-                ""
-            ])
-            
-            if create_stats['success'] > 0:
-                report_lines.extend([
-                    "#### Successfully Created Networks:",
-                    "",
-                    "| # | Network CIDR | Comment | Status |",
-                    "|---|--------------|---------|--------|"
-                ])
-                
-                for idx, result in enumerate([r for r in create_results if r.get('action') == 'created'], 1):
-                    report_lines.append(
-                        f"| {idx} | `{result['cidr']}` | Created | ✅ |"
-                    )
-                
-                report_lines.append("")
-            
-            if create_stats['failed'] > 0:
-                report_lines.extend([
-                    "#### Failed Creation Attempts:",
-                    "",
-                    "| # | Network CIDR | Error Message | Action Required |",
-                    "|---|--------------|---------------|-----------------|"
-                ])
-                
-                for idx, result in enumerate([r for r in create_results if r.get('action') == 'error'], 1):
-                    error_msg = result.get('error', 'Unknown error')[:50]
-                    report_lines.append(
-                        f"| {idx} | `{result['cidr']}` | {error_msg}... | Review error |"
-                    )
-                
-                report_lines.append("")
-        
-        # Update operations
-        if 'update' in operation_results:
-            update_results = operation_results['update']
-            update_stats = self._calculate_operation_stats(update_results)
-            
-            report_lines.extend([
-                "### Network Update Operations",
-                "",
-                f"- **Total Attempted**: {update_stats['total']}",
-                f"- **✅ Successful**: {update_stats['success']}",
-                f"- **❌ Failed**: {update_stats['failed']}",
-                f"- **Success Rate**: {update_stats['success_rate']:.1f}%",
-                ""
-            ])
-        
-        # Recommendations
-        report_lines.extend([
-            "## 💡 Post-Operation Recommendations",
-            ""
-        ])
-        
-        any_failures = False
-        if 'create' in operation_results:
-            if self._calculate_operation_stats(operation_results['create'])['failed'] > 0:
+        # Stats are reused by the recommendations block - compute them once
+        create_stats = (self._calculate_operation_stats(operation_results['create'])
+                        if 'create' in operation_results else None)
+        update_stats = (self._calculate_operation_stats(operation_results['update'])
+                        if 'update' in operation_results else None)
+
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20,
+                  newline='\n') as f:
+            w = f.write
+
+            w(f"""# InfoBlox Operation Results Report
+*Executed on {self.timestamp_str}*
+
+## 🚀 Operation Summary
+
+""")
+
+            # Create operations
+            if create_stats is not None:
+                create_results = operation_results['create']
+
+                w(f"""### Network Creation Operations
+
+- **Total Attempted**: {create_stats['total']}
+- **✅ Successful**: {create_stats['success']}
+- **❌ Failed**: {create_stats['failed']}
+- **Success Rate**: {create_stats['success_rate']:.1f}%
+
+""")
+
+                # Partition once instead of filtering the result list per table
+                created, errored = [], []
+                for result in create_results:
+                    action = result.get('action')
+                    if action == 'created':
+                        created.append(result)
+                    elif action == 'error':
+                        errored.append(result)
+
+                if created:
+                    w(_CREATED_HEADER)
+
+                    for idx, result in enumerate(created, 1):
+                        w(f"| {idx} | `{result['cidr']}` | Created | ✅ |\n")
+
+                    w("\n")
+
+                if errored:
+                    w(_FAILED_HEADER)
+
+                    for idx, result in enumerate(errored, 1):
+                        error_msg = result.get('error', 'Unknown error')[:50]
+                        w(f"| {idx} | `{result['cidr']}` | {error_msg}... | Review error |\n")
+
+                    w("\n")
+
+            # Update operations
+            if update_stats is not None:
+                w(f"""### Network Update Operations
+
+- **Total Attempted**: {update_stats['total']}
+- **✅ Successful**: {update_stats['success']}
+- **❌ Failed**: {update_stats['failed']}
+- **Success Rate**: {update_stats['success_rate']:.1f}%
+
+""")
+
+            # Recommendations
+            w("## 💡 Post-Operation Recommendations\n\n")
+
+            any_failures = False
+            if create_stats is not None and create_stats['failed'] > 0:
                 any_failures = True
-                report_lines.append("1. **Review failed network creations** - Check error messages and resolve issues")
-        
-        if 'update' in operation_results:
-            if self._calculate_operation_stats(operation_results['update'])['failed'] > 0:
+                w("1. **Review failed network creations** - Check error messages and resolve issues\n")
+
+            if update_stats is not None and update_stats['failed'] > 0:
                 any_failures = True
-                report_lines.append("2. **Review failed network updates** - Verify permissions and data validity")
-        
-        if not any_failures:
-            report_lines.append("✅ **All operations completed successfully!**")
-        
-        report_lines.extend([
-            "",
-            "---",
-            f"*Operation Results Report generated on {self.timestamp_str}*"
-        ])
-        
-        with open(filename, 'w') as f:
-            f.write('\n'.join(report_lines))
-        
+                w("2. **Review failed network updates** - Verify permissions and data validity\n")
+
+            if not any_failures:
+                w("✅ **All operations completed successfully!**\n")
+
+            w(f"""
+---
+*Operation Results Report generated on {self.timestamp_str}*""")
+
+
         return filename
     
     def generate_network_creation_report(self, network_creation_list: Dict, network_view: str) -> str:
         """Generate detailed network creation list report"""
-        filename = f"{self.output_dir}/network_creation_list_{self.date_str}.md"
-        
-        report_lines = [
-            "# Network Creation List Report",
-            f"*Generated on {self.timestamp_str}*",
-            "",
-            f"**Network View**: `{network_view}`",
-            "",
-            "## 📋 Summary",
-            "",
-            f"- **Total Networks to Create**: {network_creation_list['total_count']}",
-            f"- **Required Extended Attributes**: {len(network_creation_list['required_eas'])}",
-            f"- **Regions Involved**: {len(network_creation_list['summary_by_region'])}",
-            f"- **AWS Accounts**: {len(network_creation_list['summary_by_account'])}",
-            f"- **Environments**: {len(network_creation_list['summary_by_environment'])}",
-            "",
-            "## 🌍 Distribution by Region",
-            "",
-            "| Region | Networks | Percentage |",
-            "|--------|----------|------------|"
-        ]
-        
-        total = network_creation_list['total_count']
-        for region, count in sorted(network_creation_list['summary_by_region'].items(), 
-                                   key=lambda x: x[1], reverse=True):
-            pct = (count / total * 100) if total > 0 else 0
-            report_lines.append(f"| {region} | {count} | {pct:.1f}% |")
-        
-        # Environment distribution
-        report_lines.extend([
-            "",
-            "## 🏗️ Distribution by Environment",
-            "",
-            "| Environment | Networks | Percentage |",
-            "|-------------|----------|------------|"
-        ])
-        
-        for env, count in sorted(network_creation_list['summary_by_environment'].items(), 
-                                key=lambda x: x[1], reverse=True):
-            pct = (count / total * 100) if total > 0 else 0
-            report_lines.append(f"| {env} | {count} | {pct:.1f}% |")
-        
-        # Account distribution
-        report_lines.extend([
-            "",
-            "## 🏢 Distribution by AWS Account",
-            "",
-            "| Account ID | Networks | Percentage |",
-            "|------------|----------|------------|"
-        ])
-        
-        for account, count in sorted(network_creation_list['summary_by_account'].items(), 
-                                    key=lambda x: x[1], reverse=True):
-            pct = (count / total * 100) if total > 0 else 0
-            report_lines.append(f"| {account} | {count} | {pct:.1f}% |")
-        
-        # Required Extended Attributes
-        report_lines.extend([
-            "",
-            "## 🏷️ Required Extended Attributes",
-            "",
-            "The following Extended Attributes will be needed in InfoBlox:",
-            ""
-        ])
-        
-        for ea in network_creation_list['required_eas']:
-            report_lines.append(f"- `{ea}`")
-        
-        # Detailed network list
-        report_lines.extend([
-            "",
-            "## 📋 Detailed Network Creation List",
-            "",
-            "| Priority | CIDR Block | VPC Name | Account | Region | Environment | State |",
-            "|----------|------------|----------|---------|--------|-------------|-------|"
-        ])
-        
-        for network in network_creation_list['networks_to_create']:
-            env = network['aws_tags'].get('environment', 
-                                        network['aws_tags'].get('Environment', 'unknown'))
-            report_lines.append(
-                f"| {network['priority']} | `{network['cidr']}` | {network['vpc_name']} | "
-                f"{network['account_id']} | {network['region']} | {env} | {network['state']} |"
-            )
-        
-        # Quick creation commands
-        report_lines.extend([
-            "",
-            "## 🚀 Quick Actions",
-            "",
-            "### Create All Networks (Dry Run)",
-            "```bash",
-            f"python aws_infoblox_vpc_manager.py --network-view {network_view} --create-missing --dry-run",
-            "```",
-            "",
-            "### Create All Networks (Execute)",
-            "```bash",
-            f"python aws_infoblox_vpc_manager.py --network-view {network_view} --create-missing",
-            "```",
-            "",
-            "### Create by Priority (High Priority First)",
-            "Create production and staging environments first:",
-            "```bash",
-            "# Filter by environment in your CSV if needed",
-            f"python aws_infoblox_vpc_manager.py --network-view {network_view} --create-missing --dry-run",
-            "```",
-            "",
-            "---",
-            f"*Network Creation List generated on {self.timestamp_str}*"
-        ])
-        
-        with open(filename, 'w') as f:
-            f.write('\n'.join(report_lines))
+        filename = self._dated_path('network_creation_list')
         
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20,
+                  newline='\n') as f:
+            w = f.write
+
+            w(f"""# Network Creation List Report
+*Generated on {self.timestamp_str}*
+
+**Network View**: `{network_view}`
+
+## 📋 Summary
+
+- **Total Networks to Create**: {network_creation_list['total_count']}
+- **Required Extended Attributes**: {len(network_creation_list['required_eas'])}
+- **Regions Involved**: {len(network_creation_list['summary_by_region'])}
+- **AWS Accounts**: {len(network_creation_list['summary_by_account'])}
+- **Environments**: {len(network_creation_list['summary_by_environment'])}
+
+## 🌍 Distribution by Region
+
+| Region | Networks | Percentage |
+|--------|----------|------------|
+""")
+
+            # Percentage factor, shared by the three summary tables
+            total = network_creation_list['total_count']
+            inv = 100.0 / total if total > 0 else 0.0
+
+            for region, count in sorted(network_creation_list['summary_by_region'].items(),
+                                       key=itemgetter(1), reverse=True):
+                w(f"| {region} | {count} | {count * inv:.1f}% |\n")
+
+            # Environment distribution
+            w("""
+## 🏗️ Distribution by Environment
+
+| Environment | Networks | Percentage |
+|-------------|----------|------------|
+""")
+
+            for env, count in sorted(network_creation_list['summary_by_environment'].items(),
+                                    key=itemgetter(1), reverse=True):
+                w(f"| {env} | {count} | {count * inv:.1f}% |\n")
+
+            # Account distribution
+            w("""
+## 🏢 Distribution by AWS Account
+
+| Account ID | Networks | Percentage |
+|------------|----------|------------|
+""")
+
+            for account, count in sorted(network_creation_list['summary_by_account'].items(),
+                                        key=itemgetter(1), reverse=True):
+                w(f"| {account} | {count} | {count * inv:.1f}% |\n")
+
+            # Required Extended Attributes
+            w("""
+## 🏷️ Required Extended Attributes
+
+The following Extended Attributes will be needed in InfoBlox:
+
+""")
+
+            for ea in network_creation_list['required_eas']:
+                w(f"- `{ea}`\n")
+
+            # Detailed network list
+            w("""
+## 📋 Detailed Network Creation List
+
+| Priority | CIDR Block | VPC Name | Account | Region | Environment | State |
+|----------|------------|----------|---------|--------|-------------|-------|
+""")
+
+            for network in network_creation_list['networks_to_create']:
+                tags = network['aws_tags']
+                env = tags.get('environment', tags.get('Environment', 'unknown'))
+                w(_CREATE_ROW % (network['priority'], network['cidr'], network['vpc_name'],
+                                 network['account_id'], network['region'], env, network['state']))
+
+            # Quick creation commands
+            w(f"""
+## 🚀 Quick Actions
+
+### Create All Networks (Dry Run)
+```bash
+python aws_infoblox_vpc_manager.py --network-view {network_view} --create-missing --dry-run
+```
+
+### Create All Networks (Execute)
+```bash
+python aws_infoblox_vpc_manager.py --network-view {network_view} --create-missing
+```
+
+### Create by Priority (High Priority First)
+Create production and staging environments first:
+```bash
+# Filter by environment in your CSV if needed
+python aws_infoblox_vpc_manager.py --network-view {network_view} --create-missing --dry-run
+```
+
+---
+*Network Creation List generated on {self.timestamp_str}*""")
+
+
         return filename
     
     def generate_extended_attribute_report(self, ea_analysis: Dict) -> str:
         """Generate Extended Attribute analysis and status report"""
-        filename = f"{self.output_dir}/extended_attributes_{self.date_str}.md"
-        
-        report_lines = [
-            "# Extended Attributes Analysis Report",
-            f"*Generated on {self.timestamp_str}*",
-            "",
-            "## 📊 Extended Attributes Overview",
-            ""
-        ]
-        
-        if ea_analysis['action'] == 'dry_run':
-            report_lines.extend([
-                f"- **Required Extended Attributes**: {len(ea_analysis['required_eas'])}",
-                f"- **Currently Existing in InfoBlox**: {len(ea_analysis['existing_eas'])}",
-                f"- **Missing (Need to Create)**: {len(ea_analysis['missing_eas'])}",
-                "",
-                "## 🔍 Analysis Results (Dry Run)",
-                "",
-                "### ✅ Existing Extended Attributes",
-                ""
-            ])
-            
-            if ea_analysis['existing_eas']:
-                for ea in sorted(ea_analysis['existing_eas']):
-                    if ea in ea_analysis['required_eas']:
-                        report_lines.append(f"- `{ea}` ✅")
-            else:
-                report_lines.append("*No existing Extended Attributes found*")
-            
-            report_lines.extend([
-                "",
-                "### 🔴 Missing Extended Attributes",
-                ""
-            ])
-            
-            if ea_analysis['missing_eas']:
-                for ea in sorted(ea_analysis['missing_eas']):
-                    report_lines.append(f"- `{ea}` ❌ (needs to be created)")
-            else:
-                report_lines.append("✅ *All required Extended Attributes already exist*")
-            
-        else:  # action == 'ensured'
-            report_lines.extend([
-                f"- **Total Required Extended Attributes**: {len(ea_analysis['required_eas'])}",
-                f"- **Created in this session**: {ea_analysis['created_count']}",
-                f"- **Already existed**: {ea_analysis['existing_count']}",
-                "",
-                "## ✅ Extended Attributes Status",
-                ""
-            ])
-            
-            for ea_name, status in sorted(ea_analysis['ea_results'].items()):
-                if status == 'created':
-                    report_lines.append(f"- `{ea_name}` 🆕 Created")
+        filename = self._dated_path('extended_attributes')
+
+        # Memoise the sorted EA names per analysis dict - held on the
+        # generator, not the caller's payload, so nothing private leaks
+        # into the JSON artifacts
+        cached = self._ea_sorted_cache
+        if cached is not None and cached[0] is ea_analysis:
+            required_sorted = cached[1]
+        else:
+            required_sorted = tuple(sorted(ea_analysis['required_eas']))
+            self._ea_sorted_cache = (ea_analysis, required_sorted)
+
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20,
+                  newline='\n') as f:
+            w = f.write
+
+            w(f"""# Extended Attributes Analysis Report
+*Generated on {self.timestamp_str}*
+
+## 📊 Extended Attributes Overview
+
+""")
+
+            if ea_analysis['action'] == 'dry_run':
+                w(f"""- **Required Extended Attributes**: {len(ea_analysis['required_eas'])}
+- **Currently Existing in InfoBlox**: {len(ea_analysis['existing_eas'])}
+- **Missing (Need to Create)**: {len(ea_analysis['missing_eas'])}
+
+## 🔍 Analysis Results (Dry Run)
+
+### ✅ Existing Extended Attributes
+
+""")
+
+                if ea_analysis['existing_eas']:
+                    for ea in sorted(ea_analysis['existing_eas']):
+                        if ea in ea_analysis['required_eas']:
+                            w(f"- `{ea}` ✅\n")
                 else:
-                    report_lines.append(f"- `{ea_name}` ✅ Already existed")
-        
-        # Required EAs details
-        report_lines.extend([
-            "",
-            "## 📋 Complete List of Required Extended Attributes",
-            "",
-            "| EA Name | Description | Data Type | Purpose |",
-            "|---------|-------------|-----------|---------|"
-        ])
-        
-        ea_descriptions = {
-            'aws_name': 'AWS VPC Name', 
-            'environment': 'Environment (prod/staging/test/dev)',
-            'owner': 'Resource Owner',
-            'project': 'Project Name',
-            'aws_location': 'AWS Region/Location',
-            'aws_cloudservice': 'AWS Cloud Service Type',
-            'aws_created_by': 'Created By User',
-            'aws_requested_by': 'Requested By User',
-            'aws_dud': 'DUD Number',
-            'aws_account_id': 'AWS Account ID',
-            'aws_region': 'AWS Region',
-            'aws_vpc_id': 'AWS VPC ID',
-            'description': 'VPC Description',
-            'aws_tfc_created': 'Terraform Cloud Created Flag',
-            'aws_tfe_created': 'Terraform Enterprise Created Flag'
-        }
-        
-        for ea in sorted(ea_analysis['required_eas']):
-            description = ea_descriptions.get(ea, 'AWS tag mapping')
-            report_lines.append(f"| `{ea}` | {description} | STRING | AWS Tag Mapping |")
-        
-        # Recommendations
-        report_lines.extend([
-            "",
-            "## 💡 Recommendations",
-            ""
-        ])
-        
-        if ea_analysis['action'] == 'dry_run' and ea_analysis['missing_eas']:
-            report_lines.extend([
-                "### ⚠️ Missing Extended Attributes Need to be Created",
-                "",
-                f"**{len(ea_analysis['missing_eas'])} Extended Attributes** must be created in InfoBlox before networks can be successfully created.",
-                "",
-                "#### 📋 Complete List of Extended Attributes to Create:",
-                "",
-                "| EA Name | Data Type | Comment | Status |",
-                "|---------|-----------|---------|--------|"
-            ])
-            
-            for ea in sorted(ea_analysis['missing_eas']):
-                ea_descriptions = {
-                    'aws_name': 'AWS VPC Name', 
-                    'environment': 'Environment (prod/staging/test/dev)',
-                    'owner': 'Resource Owner',
-                    'project': 'Project Name',
-                    'aws_location': 'AWS Region/Location',
-                    'aws_cloudservice': 'AWS Cloud Service Type',
-                    'aws_created_by': 'Created By User',
-                    'aws_requested_by': 'Requested By User',
-                    'aws_dud': 'DUD Number',
-                    'aws_account_id': 'AWS Account ID',
-                    'aws_region': 'AWS Region',
-                    'aws_vpc_id': 'AWS VPC ID',
-                    'description': 'VPC Description',
-                    'aws_tfc_created': 'Terraform Cloud Created Flag',
-                    'aws_tfe_created': 'Terraform Enterprise Created Flag'
-                }
-                description = ea_descriptions.get(ea, 'AWS tag mapping')
-                report_lines.append(f"| `{ea}` | STRING | {description} | ❌ Missing |")
-            
-            report_lines.extend([
-                "",
-                "#### 🚀 Automatic Creation Commands:",
-                "",
-                "**Option 1: Automatic Creation (Recommended)**",
-                "```bash",
-                "# This will automatically create all missing EAs before creating networks:",
-                "python aws_infoblox_vpc_manager.py --create-missing",
-                "```",
-                "",
-                "**Option 2: Manual Creation in InfoBlox GUI**",
-                "1. Log into InfoBlox Grid Manager",
-                "2. Navigate to Administration → Extensible Attributes",
-                "3. Click 'Add' and create each EA with these settings:",
-                "   - **Data Type**: STRING",
-                "   - **Default Value**: (leave empty)",
-                "   - **Comment**: Use descriptions from table above",
-                "",
-                f"**⚠️ Important**: All {len(ea_analysis['missing_eas'])} Extended Attributes must be created before network creation will succeed."
-            ])
-        elif ea_analysis['action'] == 'ensured':
-            if ea_analysis['created_count'] > 0:
-                report_lines.extend([
-                    "### Extended Attributes Successfully Created",
-                    "",
-                    f"✅ {ea_analysis['created_count']} new Extended Attributes were created",
-                    f"✅ {ea_analysis['existing_count']} Extended Attributes already existed",
-                    "",
-                    "Your InfoBlox system is now ready for network creation with proper Extended Attributes."
-                ])
-            else:
-                report_lines.append("✅ **All required Extended Attributes already existed** - no action needed")
-        
-        # Best practices
-        report_lines.extend([
-            "",
-            "## 📚 Extended Attributes Best Practices",
-            "",
-            "### Naming Convention",
-            "- Use lowercase with underscores: `aws_vpc_id`",
-            "- Prefix AWS-specific attributes with `aws_`",
-            "- Keep names descriptive but concise",
-            "",
-            "### Data Types",
-            "- Use STRING for most AWS tag values",
-            "- Consider ENUM for standardized values (environments)",
-            "- Use appropriate length limits for values",
-            "",
-            "### Maintenance",
-            "- Regularly review unused Extended Attributes",
-            "- Document the purpose of each attribute",
-            "- Consider archiving obsolete attributes",
-            "",
-            "---",
-            f"*Extended Attributes Report generated on {self.timestamp_str}*"
-        ])
-        
-        with open(filename, 'w') as f:
-            f.write('\n'.join(report_lines))
-        
+                    w("*No existing Extended Attributes found*\n")
+
+                w("\n### 🔴 Missing Extended Attributes\n\n")
+
+                if ea_analysis['missing_eas']:
+                    for ea in sorted(ea_analysis['missing_eas']):
+                        w(f"- `{ea}` ❌ (needs to be created)\n")
+                else:
+                    w("✅ *All required Extended Attributes already exist*\n")
+
+            else:  # action == 'ensured'
+                w(f"""- **Total Required Extended Attributes**: {len(ea_analysis['required_eas'])}
+- **Created in this session**: {ea_analysis['created_count']}
+- **Already existed**: {ea_analysis['existing_count']}
+
+## ✅ Extended Attributes Status
+
+""")
+
+                for ea_name, status in sorted(ea_analysis['ea_results'].items()):
+                    if status == 'created':
+                        w(f"- `{ea_name}` 🆕 Created\n")
+                    else:
+                        w(f"- `{ea_name}` ✅ Already existed\n")
+
+            # Required EAs details
+            w(_EA_REQUIRED_TABLE_HEADER)
+
+            w(''.join(map(_EA_REQUIRED_ROW, required_sorted,
+                          (_EA_DESCRIPTIONS.get(ea, 'AWS tag mapping')
+                           for ea in required_sorted))))
+
+            # Recommendations
+            w("\n## 💡 Recommendations\n\n")
+
+            if ea_analysis['action'] == 'dry_run' and ea_analysis['missing_eas']:
+                # Bind the missing list once for the whole section
+                missing = ea_analysis['missing_eas']
+                n_missing = len(missing)
+                missing_sorted = sorted(missing)
+                w(f"""### ⚠️ Missing Extended Attributes Need to be Created
+
+**{n_missing} Extended Attributes** must be created in InfoBlox before networks can be successfully created.
+
+#### 📋 Complete List of Extended Attributes to Create:
+
+| EA Name | Data Type | Comment | Status |
+|---------|-----------|---------|--------|
+""")
+
+                w(''.join(map(_EA_MISSING_ROW, missing_sorted,
+                              (_EA_DESCRIPTIONS.get(ea, 'AWS tag mapping')
+                               for ea in missing_sorted))))
+
+                w(_EA_CREATE_COMMANDS_TMPL % n_missing)
+            elif ea_analysis['action'] == 'ensured':
+                created_count = ea_analysis['created_count']
+                if created_count > 0:
+                    w(f"""### Extended Attributes Successfully Created
+
+✅ {created_count} new Extended Attributes were created
+✅ {ea_analysis['existing_count']} Extended Attributes already existed
+
+Your InfoBlox system is now ready for network creation with proper Extended Attributes.
+""")
+                else:
+                    w("✅ **All required Extended Attributes already existed** - no action needed\n")
+
+            # Best practices
+            w(_EA_BEST_PRACTICES)
+            w(f"*Extended Attributes Report generated on {self.timestamp_str}*")
+
+
         return filename
     
     def generate_index_report(self, reports: Dict[str, str]) -> str:
         """Generate index file linking to all reports"""
         filename = f"{self.output_dir}/index.md"
-        
-        report_lines = [
-            "# AWS-InfoBlox VPC Reports Index",
-            f"*Generated on {self.timestamp_str}*",
-            "",
-            "## 📁 Available Reports",
-            ""
-        ]
-        
-        report_descriptions = {
-            'executive': '📊 Executive Summary - High-level overview and metrics',
-            'comparison': '🔍 Detailed Comparison Report - Full VPC comparison analysis',
-            'tag_analysis': '🏷️ Tag Analysis Report - AWS tag usage and compliance',
-            'network_creation': '📋 Network Creation List - Prioritized list of networks to create',
-            'extended_attributes': '🏷️ Extended Attributes Report - EA analysis and status',
-            'operations': '🚀 Operation Results - Results of create/update operations'
-        }
-        
-        for report_type, filepath in reports.items():
-            if report_type != 'index' and os.path.exists(filepath):
-                filename_only = os.path.basename(filepath)
-                description = report_descriptions.get(report_type, 'Report')
-                report_lines.append(f"- [{description}](./{filename_only})")
-        
-        report_lines.extend([
-            "",
-            "## 🔗 Quick Links",
-            "",
-            "- [AWS-InfoBlox VPC Manager Documentation](../README.md)",
-            "- [Quick Start Guide](../QUICK_START.md)",
-            "",
-            "---",
-            f"*Report index generated on {self.timestamp_str}*"
-        ])
-        
-        with open(filename, 'w') as f:
-            f.write('\n'.join(report_lines))
-        
+
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20,
+                  newline='\n') as f:
+            w = f.write
+
+            w(f"""# AWS-InfoBlox VPC Reports Index
+*Generated on {self.timestamp_str}*
+
+## 📁 Available Reports
+
+""")
+
+            # One directory scan instead of a stat call per report file
+            with os.scandir(self.output_dir) as it:
+                present = {entry.name for entry in it}
+
+            for report_type, filepath in reports.items():
+                # Index only the markdown reports, not the raw .json payloads
+                if report_type == 'index' or report_type.endswith('_json'):
+                    continue
+                filename_only = filepath.rsplit('/', 1)[-1]
+                if filename_only in present:
+                    description = self._REPORT_DESCRIPTIONS.get(report_type, 'Report')
+                    w(f"- [{description}](./{filename_only})\n")
+
+            w(f"""
+## 🔗 Quick Links
+
+- [AWS-InfoBlox VPC Manager Documentation](../README.md)
+- [Quick Start Guide](../QUICK_START.md)
+
+---
+*Report index generated on {self.timestamp_str}*""")
+
         return filename
     
     # Helper methods
@@ -875,36 +1059,29 @@ class EnhancedReportGenerator:
                 len(comparison_results.get('discrepancies', [])) + 
                 len(comparison_results.get('errors', [])))
     
-    def _generate_sync_chart(self, comparison_results: Dict) -> str:
+    def _generate_sync_chart(self, ctx: _ReportContext) -> str:
         """Generate ASCII sync status chart"""
-        total = self._get_total_vpcs(comparison_results)
+        total = ctx.total
         if total == 0:
             return "No VPCs analyzed"
-        
-        matches_pct = len(comparison_results['matches']) / total * 100
-        missing_pct = len(comparison_results['missing']) / total * 100
-        discrepancies_pct = len(comparison_results['discrepancies']) / total * 100
-        errors_pct = len(comparison_results['errors']) / total * 100
-        
-        chart = "```\n"
-        chart += "Sync Status Distribution:\n"
-        chart += f"✅ Synced      : {'█' * int(matches_pct/2)} {matches_pct:.1f}%\n"
-        chart += f"🔴 Missing     : {'█' * int(missing_pct/2)} {missing_pct:.1f}%\n"
-        chart += f"🟡 Discrepant  : {'█' * int(discrepancies_pct/2)} {discrepancies_pct:.1f}%\n"
-        chart += f"❌ Errors      : {'█' * int(errors_pct/2)} {errors_pct:.1f}%\n"
-        chart += "```"
-        
-        return chart
+
+        inv = 100.0 / total
+        matches_pct = ctx.n_match * inv
+        missing_pct = ctx.n_miss * inv
+        discrepancies_pct = ctx.n_disc * inv
+        errors_pct = ctx.n_err * inv
+
+        # One f-string instead of incremental += concatenation
+        return (f"```\n"
+                f"Sync Status Distribution:\n"
+                f"✅ Synced      : {'█' * int(matches_pct / 2)} {matches_pct:.1f}%\n"
+                f"🔴 Missing     : {'█' * int(missing_pct / 2)} {missing_pct:.1f}%\n"
+                f"🟡 Discrepant  : {'█' * int(discrepancies_pct / 2)} {discrepancies_pct:.1f}%\n"
+                f"❌ Errors      : {'█' * int(errors_pct / 2)} {errors_pct:.1f}%\n"
+                f"```")
     
-    def _generate_region_distribution(self, comparison_results: Dict) -> List[str]:
-        """Generate region distribution analysis"""
-        region_counts = {}
-        
-        for category in ['matches', 'missing', 'discrepancies']:
-            for item in comparison_results.get(category, []):
-                region = item['vpc'].get('Region', 'Unknown')
-                region_counts[region] = region_counts.get(region, 0) + 1
-        
+    def _generate_region_distribution(self, region_counts: Counter) -> List[str]:
+        """Render the region distribution table from precomputed counts"""
         if not region_counts:
             return []
         
@@ -916,23 +1093,15 @@ class EnhancedReportGenerator:
             "|------------|-----------|------------|"
         ]
         
-        total_with_region = sum(region_counts.values())
-        for region, count in sorted(region_counts.items(), key=lambda x: x[1], reverse=True):
-            pct = count / total_with_region * 100
-            lines.append(f"| {region} | {count} | {pct:.1f}% |")
-        
+        append = lines.append
+        inv = 100.0 / sum(region_counts.values())
+        for region, count in sorted(region_counts.items(), key=itemgetter(1), reverse=True):
+            append(f"| {region} | {count} | {count * inv:.1f}% |")
+
         return lines
     
-    def _generate_environment_distribution(self, comparison_results: Dict) -> List[str]:
-        """Generate environment distribution analysis"""
-        env_counts = {}
-        
-        for category in ['matches', 'missing', 'discrepancies']:
-            for item in comparison_results.get(category, []):
-                aws_tags = item.get('aws_tags', {})
-                env = aws_tags.get('environment', 'Unknown')
-                env_counts[env] = env_counts.get(env, 0) + 1
-        
+    def _generate_environment_distribution(self, env_counts: Counter) -> List[str]:
+        """Render the environment distribution table from precomputed counts"""
         if not env_counts:
             return []
         
@@ -944,44 +1113,24 @@ class EnhancedReportGenerator:
             "|-------------|-----------|------------|"
         ]
         
-        total_with_env = sum(env_counts.values())
-        for env, count in sorted(env_counts.items(), key=lambda x: x[1], reverse=True):
-            pct = count / total_with_env * 100
-            lines.append(f"| {env} | {count} | {pct:.1f}% |")
-        
+        append = lines.append
+        inv = 100.0 / sum(env_counts.values())
+        for env, count in sorted(env_counts.items(), key=itemgetter(1), reverse=True):
+            append(f"| {env} | {count} | {count * inv:.1f}% |")
+
         return lines
     
-    def _analyze_tags(self, comparison_results: Dict) -> Dict:
-        """Analyze tag usage across all VPCs"""
-        tag_stats = {}
-        
-        for category in ['matches', 'missing', 'discrepancies']:
-            for item in comparison_results.get(category, []):
-                aws_tags = item.get('aws_tags', {})
-                for tag_name, tag_value in aws_tags.items():
-                    if tag_name not in tag_stats:
-                        tag_stats[tag_name] = {
-                            'count': 0,
-                            'values': set(),
-                            'value_counts': {}
-                        }
-                    tag_stats[tag_name]['count'] += 1
-                    tag_stats[tag_name]['values'].add(str(tag_value)[:50])  # Limit value length
-                    
-                    # Count occurrences of each value
-                    value_key = str(tag_value)
-                    if value_key not in tag_stats[tag_name]['value_counts']:
-                        tag_stats[tag_name]['value_counts'][value_key] = 0
-                    tag_stats[tag_name]['value_counts'][value_key] += 1
-        
-        return tag_stats
-    
     def _calculate_operation_stats(self, operation_results: List[Dict]) -> Dict:
         """Calculate statistics for operation results"""
         total = len(operation_results)
-        success = sum(1 for r in operation_results if r.get('action') in ['created', 'updated'])
-        failed = sum(1 for r in operation_results if r.get('action') == 'error')
-        
+        success = failed = 0
+        for result in operation_results:
+            action = result.get('action')
+            if action == 'created' or action == 'updated':
+                success += 1
+            elif action == 'error':
+                failed += 1
+
         return {
             'total': total,
             'success': success,
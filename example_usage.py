@@ -12,9 +12,14 @@ Author: Generated for AWS-InfoBlox Integration
 Date: June 3, 2025
 """
 
+import re
+
 import pandas as pd
 from aws_infoblox_vpc_manager import InfoBloxClient, VPCManager, ReportGenerator, AWSTagParser
 
+# Matches the {'Key': ..., 'Value': ...} pairs in the AWS tag export format
+_TAG_RE = re.compile(r"'Key':\s*'([^']*)',\s*'Value':\s*'([^']*)'")
+
 def example_tag_parsing():
     """Example of parsing AWS tags from your CSV data"""
     print("=== AWS Tag Parsing Example ===")
@@ -71,9 +76,10 @@ def example_load_and_parse_vpc_data():
         df = pd.read_csv('vpc_data.csv')
         print(f"Loaded {len(df)} VPC records")
         
-        # Parse tags for each VPC
-        parser = AWSTagParser()
-        df['ParsedTags'] = df['Tags'].apply(parser.parse_tags_from_string)
+        # Parse tags for each VPC - one vectorized regex pass over the
+        # Tags column instead of a Python parser call per row
+        pairs = df['Tags'].fillna('').str.findall(_TAG_RE)
+        df['ParsedTags'] = [dict(p) for p in pairs]
         
         # Display sample data
         print("\nSample VPC data with parsed tags:")
@@ -2,6 +2,7 @@
 """
 Interactive terminal integration test with real-time output
 """
+import glob
 import os
 import sys
 import time
@@ -15,20 +16,28 @@ print()
 
 # Test 1: Real-time output
 print("Test 1: Real-time output demonstration")
-for i in range(5):
-    print(f"  Progress: {'█' * (i+1)}{'░' * (4-i)} {(i+1)*20}%", end='\r')
-    time.sleep(0.5)
-print("\n  ✓ Real-time output working!")
+if sys.stdout.isatty():
+    for i in range(5):
+        # ANSI erase-line instead of padding with spaces
+        sys.stdout.write(f"\x1b[2K\r  Progress: {'█' * (i+1)}{'░' * (4-i)} {(i+1)*20}%")
+        sys.stdout.flush()
+        time.sleep(0.5)
+    print("\n  ✓ Real-time output working!")
+else:
+    # Piped output (e.g. CI) - skip the carriage-return animation
+    print("  Progress: █████ 100% (non-interactive, animation skipped)")
+    print("  ✓ Real-time output working!")
 print()
 
 # Test 2: Command execution
 print("Test 2: Command execution")
 try:
     if platform.system() == "Windows":
-        result = subprocess.run(['echo', 'Hello from subprocess!'], 
+        # echo is a cmd.exe builtin - pass a string so only one shell spawns
+        result = subprocess.run('echo Hello from subprocess!',
                               capture_output=True, text=True, shell=True)
     else:
-        result = subprocess.run(['echo', 'Hello from subprocess!'], 
+        result = subprocess.run(['echo', 'Hello from subprocess!'],
                               capture_output=True, text=True)
     print(f"  Command output: {result.stdout.strip()}")
     print("  ✓ Subprocess execution working!")
@@ -64,29 +73,19 @@ print()
 # Test 4: Environment variable access
 print("Test 4: Environment variables")
 important_vars = ['PATH', 'PYTHONPATH', 'VIRTUAL_ENV', 'COMSPEC', 'SHELL']
-found_vars = 0
-for var in important_vars:
-    value = os.environ.get(var)
-    if value:
-        found_vars += 1
-        print(f"  {var}: {value[:50]}{'...' if len(value) > 50 else ''}")
-print(f"  ✓ Found {found_vars}/{len(important_vars)} environment variables!")
+env = os.environ
+found = {var: env[var] for var in important_vars if env.get(var)}
+for var, value in found.items():
+    print(f"  {var}: {value[:50]}{'...' if len(value) > 50 else ''}")
+print(f"  ✓ Found {len(found)}/{len(important_vars)} environment variables!")
 print()
 
-# Test 5: System command output
-print("Test 5: System command output")
+# Test 5: File counting (no shell pipeline needed)
+print("Test 5: File counting")
 try:
-    if platform.system() == "Windows":
-        cmd = "dir /b *.py | find /c \".py\""
-        shell = True
-    else:
-        cmd = "ls -1 *.py | wc -l"
-        shell = True
-    
-    result = subprocess.run(cmd, capture_output=True, text=True, shell=shell)
-    py_count = result.stdout.strip()
+    py_count = len(glob.glob('*.py'))
     print(f"  Python files in current directory: {py_count}")
-    print("  ✓ System commands working!")
+    print("  ✓ File counting working!")
 except Exception as e:
     print(f"  ✗ Error: {e}")
 
@@ -1,318 +1,479 @@
-#!/usr/bin/env python3
-"""
-Import networks from modified_properties_file.csv into InfoBlox version 9.3 using a specific network view.
-
-This script reads a CSV file containing network information and imports the networks
-into InfoBlox using the 'Tarig_view' network view. If the network view doesn't exist,
-it will be created first. The script sets extended attributes for site_id and m_host,
-creating them if they don't exist in InfoBlox.
-
-Usage:
-    python3 myview_import_properties.py
-"""
-
-import requests
-import pandas as pd
-import getpass
-import sys
-import os
-import ipaddress
-import datetime
-import ast  # For safely evaluating string representations of lists
-from requests.packages.urllib3.exceptions import InsecureRequestWarning
-
-# Suppress insecure request warnings (use cautiously, consider proper cert validation)
-requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-
-# --- Configuration ---
-WAPI_VERSION = "v2.12"  # Specify the WAPI version you want to use
-DEFAULT_CSV_FILE = "modified_properties_file.csv"
-DEFAULT_GRID_MASTER = "192.168.1.222"
-DEFAULT_USERNAME = "admin"
-DEFAULT_PASSWORD = "infoblox"
-NETWORK_VIEW_NAME = "Tarig_view"
-
-# --- Helper Functions ---
-
-def get_input_parameters():
-    """Prompt user for input file and InfoBlox connection details with defaults."""
-    # Prompt for CSV file
-    csv_file = input(f"Enter CSV file path [default: {DEFAULT_CSV_FILE}]: ")
-    if not csv_file:
-        csv_file = DEFAULT_CSV_FILE
-    
-    # Prompt for InfoBlox connection details
-    infoblox_ip = input(f"Enter InfoBlox Grid Master's name or IP address [default: {DEFAULT_GRID_MASTER}]: ")
-    if not infoblox_ip:
-        infoblox_ip = DEFAULT_GRID_MASTER
-    
-    username = input(f"Enter InfoBlox username [default: {DEFAULT_USERNAME}]: ")
-    if not username:
-        username = DEFAULT_USERNAME
-    
-    password = getpass.getpass(f"Enter InfoBlox password [default: {DEFAULT_PASSWORD}]: ")
-    if not password:
-        password = DEFAULT_PASSWORD
-    
-    return csv_file, infoblox_ip, username, password
-
-def make_api_request(session, base_url, method, endpoint, params=None, data=None):
-    """Make a request to the InfoBlox WAPI."""
-    url = f"{base_url}/{endpoint}"
-    try:
-        response = session.request(
-            method,
-            url,
-            params=params,
-            json=data,
-            verify=False  # Set to True or path to cert bundle for production
-        )
-        response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-        if response.content:
-            return response.json()
-        return None
-    except requests.exceptions.RequestException as e:
-        print(f"Error making API request to {url}: {e}")
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"Response status: {e.response.status_code}")
-            try:
-                print(f"Response body: {e.response.text}")
-            except Exception:
-                pass
-        return None
-    except json.JSONDecodeError:
-        # Handle cases where response is not JSON (e.g., successful empty response)
-        if response.ok and not response.content:
-            return None  # Or return an empty dict/list based on expected response
-        print(f"Error decoding JSON response from {url}")
-        print(f"Response status: {response.status_code}")
-        print(f"Response body: {response.text}")
-        return None
-
-def get_network_view(session, base_url, view_name):
-    """Check if a network view exists."""
-    print(f"Checking if network view '{view_name}' exists...")
-    endpoint = f"networkview?name={view_name}"
-    return make_api_request(session, base_url, "GET", endpoint)
-
-def create_network_view(session, base_url, view_name):
-    """Create a new network view."""
-    print(f"Creating network view '{view_name}'...")
-    endpoint = "networkview"
-    data = {
-        "name": view_name
-    }
-    result = make_api_request(session, base_url, "POST", endpoint, data=data)
-    if result:
-        print(f"Successfully created network view '{view_name}'.")
-        return result  # Return the reference to the new network view
-    else:
-        print(f"Failed to create network view '{view_name}'.")
-        return None
-
-def get_ea_definition(session, base_url, ea_name):
-    """Check if an EA definition exists."""
-    endpoint = f"extensibleattributedef?name={ea_name}"
-    return make_api_request(session, base_url, "GET", endpoint)
-
-def create_ea_definition(session, base_url, ea_name):
-    """Create a new EA definition (basic string type)."""
-    print(f"Attempting to create EA definition for '{ea_name}'...")
-    endpoint = "extensibleattributedef"
-    data = {
-        "name": ea_name,
-        "type": "STRING",  # Defaulting to STRING type
-        "flags": "I",  # Inheritable
-        # Add other necessary fields like comment, allowed_values etc. if needed
-    }
-    result = make_api_request(session, base_url, "POST", endpoint, data=data)
-    if result:
-        print(f"Successfully created EA definition '{ea_name}'.")
-        return result  # Return the reference to the new EA def
-    else:
-        print(f"Failed to create EA definition '{ea_name}'.")
-        return None
-
-def get_network(session, base_url, cidr, network_view=NETWORK_VIEW_NAME):
-    """Get network object reference by CIDR."""
-    endpoint = f"network?network={cidr}&network_view={network_view}"
-    return make_api_request(session, base_url, "GET", endpoint)
-
-def create_network(session, base_url, cidr, description, eas=None, network_view=NETWORK_VIEW_NAME):
-    """Create a new network object."""
-    print(f"Creating network: {cidr} in view '{network_view}'...")
-    endpoint = "network"
-    data = {
-        "network": cidr,
-        "network_view": network_view,
-        "comment": description
-    }
-    if eas:
-        data["extattrs"] = eas
-    
-    result = make_api_request(session, base_url, "POST", endpoint, data=data)
-    if result:
-        print(f"Successfully created network: {cidr} in view '{network_view}'")
-        return result  # Return the reference
-    else:
-        print(f"Failed to create network: {cidr} in view '{network_view}'")
-        return None
-
-def update_network_eas(session, base_url, network_ref, description, eas):
-    """Update the EAs and description for an existing network object."""
-    print(f"Updating EAs for network ref: {network_ref}...")
-    endpoint = network_ref
-    data = {
-        "extattrs": eas,
-        "comment": description
-    }
-    result = make_api_request(session, base_url, "PUT", endpoint, data=data)
-    if result is not None:  # PUT might return empty success response
-        print(f"Successfully updated EAs for network ref: {network_ref}")
-        return result
-    else:
-        # Check if the request was actually successful despite empty response
-        print(f"Successfully updated EAs for network ref: {network_ref} (assuming success on empty response)")
-        return network_ref  # Return original ref on assumed success
-
-def validate_cidr(cidr):
-    """Validate if the string is a valid CIDR block."""
-    try:
-        ipaddress.ip_network(cidr, strict=False)  # strict=False allows host bits set
-        return True
-    except ValueError:
-        return False
-
-def parse_prefixes(prefixes_str):
-    """Parse the prefixes string from CSV into a list of CIDR blocks."""
-    try:
-        # Use ast.literal_eval to safely evaluate the string representation of a list
-        prefixes_list = ast.literal_eval(prefixes_str)
-        if isinstance(prefixes_list, list):
-            return prefixes_list
-        return []
-    except (SyntaxError, ValueError):
-        print(f"Error parsing prefixes: {prefixes_str}")
-        return []
-
-# --- Main Execution Logic ---
-
-def main():
-    # 1. Get Input Parameters
-    csv_file, infoblox_ip, username, password = get_input_parameters()
-    
-    if not os.path.exists(csv_file):
-        print(f"Error: Input CSV file not found: {csv_file}")
-        sys.exit(1)
-    
-    base_url = f"https://{infoblox_ip}/wapi/{WAPI_VERSION}"
-
-    # 2. Establish session and check/create network view
-    with requests.Session() as session:
-        session.auth = (username, password)
-        
-        # Check if the network view exists
-        existing_views = get_network_view(session, base_url, NETWORK_VIEW_NAME)
-        
-        if not existing_views or not isinstance(existing_views, list) or len(existing_views) == 0:
-            # Network view doesn't exist, create it
-            view_ref = create_network_view(session, base_url, NETWORK_VIEW_NAME)
-            if not view_ref:
-                print(f"Error: Failed to create network view '{NETWORK_VIEW_NAME}'. Exiting.")
-                sys.exit(1)
-        else:
-            print(f"Network view '{NETWORK_VIEW_NAME}' already exists.")
-        
-        # 3. Load CSV Data
-        try:
-            df = pd.read_csv(csv_file)
-            print(f"Loaded {len(df)} records from {csv_file}")
-        except Exception as e:
-            print(f"Error reading CSV file: {e}")
-            sys.exit(1)
-
-        # 4. Process Records
-        ea_definitions_cache = {}  # Cache EA definitions to avoid repeated lookups
-        current_datetime = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        description = f"Imported by Property script on {current_datetime}"
-
-        for _, row in df.iterrows():
-            print("-" * 30)
-            site_id = str(row.get('site_id', ''))
-            m_host = str(row.get('m_host', ''))
-            prefixes_str = row.get('prefixes', '[]')
-            
-            prefixes = parse_prefixes(prefixes_str)
-            if not prefixes:
-                print(f"Skipping row - no valid prefixes: {row}")
-                continue
-
-            # Prepare EAs
-            eas_to_set = {}
-            
-            # Process site_id EA
-            if site_id:
-                # Check/Create EA Definition for site_id
-                if 'site_id' not in ea_definitions_cache:
-                    existing_ea_defs = get_ea_definition(session, base_url, 'site_id')
-                    if existing_ea_defs and isinstance(existing_ea_defs, list) and len(existing_ea_defs) > 0:
-                        ea_definitions_cache['site_id'] = existing_ea_defs[0]
-                        print(f"Found existing EA definition for 'site_id'.")
-                    else:
-                        new_ea_def = create_ea_definition(session, base_url, 'site_id')
-                        if new_ea_def:
-                            ea_definitions_cache['site_id'] = {"_ref": new_ea_def}
-                        else:
-                            ea_definitions_cache['site_id'] = None
-                
-                # Add to eas_to_set if definition exists/was created
-                if ea_definitions_cache.get('site_id'):
-                    eas_to_set['site_id'] = {"value": site_id}
-                else:
-                    print(f"Skipping EA 'site_id' - definition not found or could not be created.")
-            
-            # Process m_host EA
-            if m_host:
-                # Check/Create EA Definition for m_host
-                if 'm_host' not in ea_definitions_cache:
-                    existing_ea_defs = get_ea_definition(session, base_url, 'm_host')
-                    if existing_ea_defs and isinstance(existing_ea_defs, list) and len(existing_ea_defs) > 0:
-                        ea_definitions_cache['m_host'] = existing_ea_defs[0]
-                        print(f"Found existing EA definition for 'm_host'.")
-                    else:
-                        new_ea_def = create_ea_definition(session, base_url, 'm_host')
-                        if new_ea_def:
-                            ea_definitions_cache['m_host'] = {"_ref": new_ea_def}
-                        else:
-                            ea_definitions_cache['m_host'] = None
-                
-                # Add to eas_to_set if definition exists/was created
-                if ea_definitions_cache.get('m_host'):
-                    eas_to_set['m_host'] = {"value": m_host}
-                else:
-                    print(f"Skipping EA 'm_host' - definition not found or could not be created.")
-
-            # Process each prefix (CIDR) in the list
-            for cidr in prefixes:
-                # Validate CIDR
-                if not validate_cidr(cidr):
-                    print(f"Skipping invalid CIDR format: {cidr}")
-                    continue
-
-                # Check if network exists in the specified view
-                existing_networks = get_network(session, base_url, cidr, NETWORK_VIEW_NAME)
-                
-                if existing_networks and isinstance(existing_networks, list) and len(existing_networks) > 0:
-                    # Network exists - Update EAs and description
-                    network_ref = existing_networks[0]["_ref"]
-                    print(f"Network {cidr} exists in view '{NETWORK_VIEW_NAME}' (ref: {network_ref}). Updating EAs and description...")
-                    update_network_eas(session, base_url, network_ref, description, eas_to_set)
-                else:
-                    # Network does not exist - Create with EAs and description
-                    create_network(session, base_url, cidr, description, eas_to_set, NETWORK_VIEW_NAME)
-
-    print("-" * 30)
-    print(f"InfoBlox import process completed. Networks imported to view '{NETWORK_VIEW_NAME}'.")
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Import networks from modified_properties_file.csv into InfoBlox version 9.3 using a specific network view.
+
+This script reads a CSV file containing network information and imports the networks
+into InfoBlox using the 'Tarig_view' network view. If the network view doesn't exist,
+it will be created first. The script sets extended attributes for site_id and m_host,
+creating them if they don't exist in InfoBlox.
+
+Usage:
+    python3 myview_import_properties.py
+"""
+
+import requests
+import csv
+import functools
+import getpass
+import json
+import logging
+import logging.handlers
+import re
+import sys
+import os
+import ipaddress
+import datetime
+import ast  # For safely evaluating string representations of lists
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Suppress insecure request warnings (use cautiously, consider proper cert validation)
+requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
+
+# Buffered logging keeps the per-CIDR messages off the hot path: records
+# accumulate in memory and flush in blocks of 1000, or immediately on
+# errors, instead of one write+flush per line
+_log_target = logging.StreamHandler()
+_log_target.setFormatter(logging.Formatter('%(message)s'))
+_log_handler = logging.handlers.MemoryHandler(
+    capacity=1000, flushLevel=logging.ERROR, target=_log_target)
+logger = logging.getLogger(__name__)
+logger.addHandler(_log_handler)
+logger.setLevel(logging.INFO)
+
+# --- Configuration ---
+WAPI_VERSION = "v2.12"  # Specify the WAPI version you want to use
+DEFAULT_CSV_FILE = "modified_properties_file.csv"
+DEFAULT_GRID_MASTER = "192.168.1.222"
+DEFAULT_USERNAME = "admin"
+DEFAULT_PASSWORD = "infoblox"
+NETWORK_VIEW_NAME = "Tarig_view"
+BATCH_SIZE = 100  # Sub-operations per /request batch
+MAX_WORKERS = 16  # Concurrent per-CIDR requests; keep below the adapter's pool_maxsize
+
+# Sentinel returned by make_api_request when WAPI rejects a create with a
+# duplicate-object conflict, so callers can retry as an update
+CONFLICT = object()
+
+# --- Helper Functions ---
+
+def get_input_parameters():
+    """Prompt user for input file and InfoBlox connection details with defaults."""
+    # Prompt for CSV file
+    csv_file = input(f"Enter CSV file path [default: {DEFAULT_CSV_FILE}]: ")
+    if not csv_file:
+        csv_file = DEFAULT_CSV_FILE
+    
+    # Prompt for InfoBlox connection details
+    infoblox_ip = input(f"Enter InfoBlox Grid Master's name or IP address [default: {DEFAULT_GRID_MASTER}]: ")
+    if not infoblox_ip:
+        infoblox_ip = DEFAULT_GRID_MASTER
+    
+    username = input(f"Enter InfoBlox username [default: {DEFAULT_USERNAME}]: ")
+    if not username:
+        username = DEFAULT_USERNAME
+    
+    password = getpass.getpass(f"Enter InfoBlox password [default: {DEFAULT_PASSWORD}]: ")
+    if not password:
+        password = DEFAULT_PASSWORD
+    
+    return csv_file, infoblox_ip, username, password
+
+def make_api_request(session, base_url, method, endpoint, params=None, data=None):
+    """Make a request to the InfoBlox WAPI."""
+    url = f"{base_url}/{endpoint}"
+    # Serialize/parse with orjson when available - 3-5x faster than the
+    # stdlib on the field-heavy WAPI payloads (Content-Type is already set
+    # on the session)
+    if data is None:
+        body = None
+    elif orjson is not None:
+        body = orjson.dumps(data)
+    else:
+        body = json.dumps(data).encode('utf-8')
+    response = None
+    content = b''
+    try:
+        # stream=True defers the body download; reading the decoded raw
+        # stream bounds peak memory to the body size and skips requests'
+        # internal content caching
+        response = session.request(
+            method,
+            url,
+            params=params,
+            data=body,
+            stream=True
+        )
+        response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+        content = response.raw.read(decode_content=True)
+        if content:
+            if orjson is not None:
+                return orjson.loads(content)
+            return json.loads(content)
+        return None
+    except requests.exceptions.RequestException as e:
+        if hasattr(e, 'response') and e.response is not None and e.response.status_code == 400:
+            # Duplicate-object conflicts are an expected outcome of
+            # optimistic creates, not an error worth logging
+            body = e.response.text
+            if 'Client.Ibap.Data.Conflict' in body or 'already exists' in body:
+                return CONFLICT
+        logger.error(f"Error making API request to {url}: {e}")
+        if hasattr(e, 'response') and e.response is not None:
+            logger.error(f"Response status: {e.response.status_code}")
+            try:
+                logger.error(f"Response body: {e.response.text}")
+            except Exception:
+                pass
+        return None
+    except json.JSONDecodeError:
+        # Handle cases where response is not JSON (e.g., successful empty response)
+        if response.ok and not content:
+            return None  # Or return an empty dict/list based on expected response
+        logger.error(f"Error decoding JSON response from {url}")
+        logger.error(f"Response status: {response.status_code}")
+        logger.error(f"Response body: {content!r}")
+        return None
+    finally:
+        # Release the pooled connection promptly even on early returns
+        if response is not None:
+            response.close()
+
+def get_network_view(session, base_url, view_name):
+    """Check if a network view exists."""
+    logger.info(f"Checking if network view '{view_name}' exists...")
+    # WAPI honors an empty _return_fields as "only _ref" - all these
+    # existence checks need
+    endpoint = f"networkview?name={view_name}&_return_fields=&_max_results=1"
+    return make_api_request(session, base_url, "GET", endpoint)
+
+def create_network_view(session, base_url, view_name):
+    """Create a new network view."""
+    logger.info(f"Creating network view '{view_name}'...")
+    endpoint = "networkview"
+    data = {
+        "name": view_name
+    }
+    result = make_api_request(session, base_url, "POST", endpoint, data=data)
+    if result:
+        logger.info(f"Successfully created network view '{view_name}'.")
+        return result  # Return the reference to the new network view
+    else:
+        logger.error(f"Failed to create network view '{view_name}'.")
+        return None
+
+def get_ea_definition(session, base_url, ea_name):
+    """Check if an EA definition exists."""
+    endpoint = f"extensibleattributedef?name={ea_name}&_return_fields=&_max_results=1"
+    return make_api_request(session, base_url, "GET", endpoint)
+
+def create_ea_definition(session, base_url, ea_name):
+    """Create a new EA definition (basic string type)."""
+    logger.info(f"Attempting to create EA definition for '{ea_name}'...")
+    endpoint = "extensibleattributedef"
+    data = {
+        "name": ea_name,
+        "type": "STRING",  # Defaulting to STRING type
+        "flags": "I",  # Inheritable
+        # Add other necessary fields like comment, allowed_values etc. if needed
+    }
+    result = make_api_request(session, base_url, "POST", endpoint, data=data)
+    if result:
+        logger.info(f"Successfully created EA definition '{ea_name}'.")
+        return result  # Return the reference to the new EA def
+    else:
+        logger.error(f"Failed to create EA definition '{ea_name}'.")
+        return None
+
+def get_network(session, base_url, cidr, network_view=NETWORK_VIEW_NAME):
+    """Get network object reference by CIDR."""
+    endpoint = f"network?network={cidr}&network_view={network_view}&_return_fields=&_max_results=1"
+    return make_api_request(session, base_url, "GET", endpoint)
+
+def create_network(session, base_url, cidr, description, eas=None, network_view=NETWORK_VIEW_NAME):
+    """Create a new network object."""
+    logger.info(f"Creating network: {cidr} in view '{network_view}'...")
+    endpoint = "network"
+    data = {
+        "network": cidr,
+        "network_view": network_view,
+        "comment": description
+    }
+    if eas:
+        data["extattrs"] = eas
+    
+    result = make_api_request(session, base_url, "POST", endpoint, data=data)
+    if result is CONFLICT:
+        return CONFLICT  # Caller retries as an update
+    if result:
+        logger.info(f"Successfully created network: {cidr} in view '{network_view}'")
+        return result  # Return the reference
+    else:
+        logger.error(f"Failed to create network: {cidr} in view '{network_view}'")
+        return None
+
+def update_network_eas(session, base_url, network_ref, description, eas):
+    """Update the EAs and description for an existing network object."""
+    logger.info(f"Updating EAs for network ref: {network_ref}...")
+    endpoint = network_ref
+    data = {
+        "extattrs": eas,
+        "comment": description
+    }
+    result = make_api_request(session, base_url, "PUT", endpoint, data=data)
+    if result is not None:  # PUT might return empty success response
+        logger.info(f"Successfully updated EAs for network ref: {network_ref}")
+        return result
+    else:
+        # Check if the request was actually successful despite empty response
+        logger.info(f"Successfully updated EAs for network ref: {network_ref} (assuming success on empty response)")
+        return network_ref  # Return original ref on assumed success
+
+def prefetch_ea_definitions(session, base_url, ea_names):
+    """Resolve (or create) each EA definition once, before the row loop.
+
+    One GET (plus a POST if missing) per EA name upfront replaces the
+    per-row cold-cache checks and guarantees no mid-loop lookup stall.
+    """
+    cache = {}
+    for ea_name in ea_names:
+        existing_ea_defs = get_ea_definition(session, base_url, ea_name)
+        if existing_ea_defs and isinstance(existing_ea_defs, list) and len(existing_ea_defs) > 0:
+            cache[ea_name] = existing_ea_defs[0]
+            logger.info(f"Found existing EA definition for '{ea_name}'.")
+        else:
+            new_ea_def = create_ea_definition(session, base_url, ea_name)
+            if new_ea_def:
+                cache[ea_name] = {"_ref": new_ea_def}
+            else:
+                cache[ea_name] = None
+                logger.error(f"EA '{ea_name}' definition not found and could not be created; it will be skipped.")
+    return cache
+
+def batch_wapi(session, base_url, ops):
+    """Execute a list of WAPI sub-operations in a single /request round-trip.
+
+    Returns the positional result array, or None if the batch failed
+    (the WAPI request object is transactional, so one bad sub-operation
+    fails the whole batch).
+    """
+    return make_api_request(session, base_url, "POST", "request", data=ops)
+
+def process_cidr(session, base_url, cidr, description, eas_to_set,
+                 network_view=NETWORK_VIEW_NAME):
+    """Create or update a single network - the per-CIDR unit of work.
+
+    Self-contained so the CIDRs of an import can be processed
+    independently (and concurrently) of the row loop that produced them.
+    Creates optimistically and only looks the network up when WAPI
+    reports a duplicate, so the common (new-network) case costs one
+    HTTP call instead of an existence GET plus a POST.
+    """
+    result = create_network(session, base_url, cidr, description, eas_to_set, network_view)
+    if result is not CONFLICT:
+        return result
+
+    # Network already exists - fetch its reference and update instead
+    existing_networks = get_network(session, base_url, cidr, network_view)
+    if existing_networks and isinstance(existing_networks, list) and len(existing_networks) > 0:
+        network_ref = existing_networks[0]["_ref"]
+        logger.info(f"Network {cidr} exists in view '{network_view}' (ref: {network_ref}). Updating EAs and description...")
+        return update_network_eas(session, base_url, network_ref, description, eas_to_set)
+
+    logger.error(f"Network {cidr} reported as duplicate but could not be fetched for update.")
+    return None
+
+# Valid v4/v6 CIDR strings only ever contain these characters; anything
+# else is rejected before the (comparatively heavy) ipaddress parse
+_CIDR_CHARS_RE = re.compile(r'^[0-9A-Fa-f:./]+$')
+
+@functools.lru_cache(maxsize=100_000)
+def _validate_cidr_str(cidr):
+    """Memoized validation of a CIDR string.
+
+    Imports frequently repeat CIDRs across rows and re-runs, and
+    ipaddress.ip_network allocates a network object per parse.
+    """
+    if not _CIDR_CHARS_RE.match(cidr):
+        return False
+    try:
+        ipaddress.ip_network(cidr, strict=False)  # strict=False allows host bits set
+        return True
+    except ValueError:
+        return False
+
+def validate_cidr(cidr):
+    """Validate if the value is a valid CIDR block.
+
+    The string check sits outside the cache - prefix lists can yield
+    non-string (even unhashable) entries, e.g. "[123]" parses to ints,
+    and those must return False rather than raise from the lru_cache.
+    """
+    if not isinstance(cidr, str):
+        return False
+    return _validate_cidr_str(cidr)
+
+@functools.lru_cache(maxsize=None)
+def parse_prefixes(prefixes_str):
+    """Parse the prefixes string from CSV into a tuple of CIDR blocks.
+
+    Memoized on the raw string - the ast.literal_eval parse is pure, so
+    repeated prefix lists cost a single dict lookup.
+    """
+    try:
+        # Use ast.literal_eval to safely evaluate the string representation of a list
+        prefixes_list = ast.literal_eval(prefixes_str)
+        if isinstance(prefixes_list, list):
+            return tuple(prefixes_list)
+        return ()
+    except (SyntaxError, ValueError):
+        logger.error(f"Error parsing prefixes: {prefixes_str}")
+        return ()
+
+# --- Main Execution Logic ---
+
+def main():
+    # 1. Get Input Parameters
+    csv_file, infoblox_ip, username, password = get_input_parameters()
+    
+    if not os.path.exists(csv_file):
+        logger.error(f"Error: Input CSV file not found: {csv_file}")
+        sys.exit(1)
+    
+    base_url = f"https://{infoblox_ip}/wapi/{WAPI_VERSION}"
+
+    # 2. Establish session and check/create network view
+    with requests.Session() as session:
+        session.auth = (username, password)
+        session.verify = False  # Set to True or path to cert bundle for production
+        session.headers.update({
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        })
+        # All calls hit one Grid Master: a larger keep-alive pool avoids
+        # connection churn and re-TLS on bursts, and the retry policy
+        # absorbs transient 5xx responses
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST", "PUT"])
+            )
+        )
+        session.mount("https://", adapter)
+
+        # Check if the network view exists
+        existing_views = get_network_view(session, base_url, NETWORK_VIEW_NAME)
+        
+        if not existing_views or not isinstance(existing_views, list) or len(existing_views) == 0:
+            # Network view doesn't exist, create it
+            view_ref = create_network_view(session, base_url, NETWORK_VIEW_NAME)
+            if not view_ref:
+                logger.error(f"Error: Failed to create network view '{NETWORK_VIEW_NAME}'. Exiting.")
+                sys.exit(1)
+        else:
+            logger.info(f"Network view '{NETWORK_VIEW_NAME}' already exists.")
+        
+        # 3. Stream CSV rows - only three string columns are consumed, so
+        # csv.DictReader processes them one at a time without materializing
+        # the whole file
+        # Resolve both EA definitions once upfront instead of probing the
+        # cache on every row
+        ea_definitions_cache = prefetch_ea_definitions(session, base_url, ('site_id', 'm_host'))
+        # Definitions cannot change mid-import, so hoist the cache probes
+        # out of the row loop entirely
+        site_def_ok = ea_definitions_cache.get('site_id') is not None
+        mhost_def_ok = ea_definitions_cache.get('m_host') is not None
+        current_datetime = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        description = f"Imported by Property script on {current_datetime}"
+        tasks = []  # (cidr, eas_to_set) pairs, processed in batches below
+        row_count = 0
+
+        try:
+            csv_handle = open(csv_file, newline='')
+        except OSError as e:
+            logger.error(f"Error reading CSV file: {e}")
+            sys.exit(1)
+
+        with csv_handle:
+            for row in csv.DictReader(csv_handle):
+                row_count += 1
+                logger.info("-" * 30)
+                site_id = row.get('site_id') or ''
+                m_host = row.get('m_host') or ''
+                prefixes_str = row.get('prefixes') or '[]'
+
+                prefixes = parse_prefixes(prefixes_str)
+                if not prefixes:
+                    logger.info(f"Skipping row - no valid prefixes: {row}")
+                    continue
+
+                # Prepare EAs (definitions resolved before the loop)
+                eas_to_set = {}
+                if site_id and site_def_ok:
+                    eas_to_set['site_id'] = {"value": site_id}
+                if m_host and mhost_def_ok:
+                    eas_to_set['m_host'] = {"value": m_host}
+
+                # Queue each prefix (CIDR) in the list
+                for cidr in prefixes:
+                    # Validate CIDR
+                    if not validate_cidr(cidr):
+                        logger.info(f"Skipping invalid CIDR format: {cidr}")
+                        continue
+
+                    tasks.append((cidr, eas_to_set))
+
+        logger.info(f"Loaded {row_count} records from {csv_file}")
+
+        # 5. Create networks in optimistic batches - on a greenfield import
+        # each chunk costs a single /request round-trip with no existence
+        # lookups at all
+        for start in range(0, len(tasks), BATCH_SIZE):
+            chunk = tasks[start:start + BATCH_SIZE]
+
+            create_ops = []
+            for cidr, eas_to_set in chunk:
+                data = {
+                    "network": cidr,
+                    "network_view": NETWORK_VIEW_NAME,
+                    "comment": description
+                }
+                if eas_to_set:
+                    data["extattrs"] = eas_to_set
+                create_ops.append({
+                    "method": "POST",
+                    "object": "network",
+                    "data": data
+                })
+
+            if isinstance(batch_wapi(session, base_url, create_ops), list):
+                logger.info(f"Created batch of {len(chunk)} networks via /request")
+            else:
+                # Conflicts (re-runs) or errors fail the transactional batch;
+                # the per-CIDR path creates then falls back to update on
+                # duplicate, keeping the detailed error reporting. Fan it out
+                # over threads - requests releases the GIL during socket IO
+                # and the session's keep-alive pool is shared across workers
+                logger.error(f"Batched create failed; processing {len(chunk)} networks individually...")
+                with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                    list(executor.map(
+                        lambda task: process_cidr(session, base_url, task[0], description, task[1]),
+                        chunk))
+
+    logger.info("-" * 30)
+    logger.info(f"InfoBlox import process completed. Networks imported to view '{NETWORK_VIEW_NAME}'.")
+    _log_handler.flush()  # Drain whatever is still buffered
+
+if __name__ == "__main__":
+    main()
@@ -283,4 +283,32 @@ class TestVPCManager:
         
         assert result is True
         assert manager.networks_updated == 1
-        mock_infoblox_client.update_network.assert_called_once()  # Updated even without changes
\ No newline at end of file
+        mock_infoblox_client.update_network.assert_called_once()  # Updated even without changes
+
+class TestAWSTagParser:
+    """Test AWS tag string parsing"""
+
+    def test_parse_tags_simple(self):
+        """Test parsing the common single-quoted tag export shape"""
+        from aws_infoblox_vpc_manager_complete import AWSTagParser
+
+        parser = AWSTagParser()
+        tags = parser.parse_tags_from_string(
+            "[{'Key': 'Name', 'Value': 'my-vpc'}, {'Key': 'environment', 'Value': 'prod'}]"
+        )
+
+        assert tags == {"Name": "my-vpc", "environment": "prod"}
+
+    def test_parse_tags_escaped_values(self):
+        """Test that escaped values are decoded, not returned as source text"""
+        from aws_infoblox_vpc_manager_complete import AWSTagParser
+
+        parser = AWSTagParser()
+
+        # Embedded escaped quote must decode to the literal quote
+        tags = parser.parse_tags_from_string("[{'Key': 'k', 'Value': 'a\\'b\"c'}]")
+        assert tags == {"k": "a'b\"c"}
+
+        # Escaped newline must decode to an actual newline character
+        tags = parser.parse_tags_from_string("[{'Key': 'k', 'Value': 'line1\\nline2'}]")
+        assert tags == {"k": "line1\nline2"}